@@ -0,0 +1,65 @@
+"""Tests for membrane properties handler."""
+
+import pytest
+from utils.membrane_properties_handler import (
+    get_membrane_from_catalog,
+    get_membrane_properties_mcas,
+    _get_membrane_from_catalog_cached,
+    _get_membrane_properties_mcas_cached,
+)
+
+# (public lookup, backing cache, positional args)
+CACHED_LOOKUPS = [
+    pytest.param(
+        get_membrane_from_catalog, _get_membrane_from_catalog_cached,
+        ('BW30_PRO_400', ['Na+', 'Cl-']),
+        id="catalog",
+    ),
+    pytest.param(
+        get_membrane_properties_mcas, _get_membrane_properties_mcas_cached,
+        ('brackish', None, ['Na_+', 'Cl_-', 'Ca_2+']),
+        id="mcas_heuristic",
+    ),
+]
+
+
+class TestMembraneLookupCache:
+    """Test caching of catalog and heuristic membrane lookups."""
+
+    @pytest.mark.parametrize("lookup, cached, args", CACHED_LOOKUPS)
+    def test_repeated_lookup_hits_cache(self, lookup, cached, args):
+        """Repeated lookups with identical keys reuse the cached entry."""
+        cached.cache_clear()
+        assert lookup(*args) == lookup(*args)
+        assert cached.cache_info().hits == 1
+
+    @pytest.mark.parametrize("lookup, cached, args", CACHED_LOOKUPS)
+    def test_returned_dict_is_independent(self, lookup, cached, args):
+        """Mutating a result must not affect later lookups."""
+        props = lookup(*args)
+        expected = lookup(*args)
+        props['A_w'] = 0.0
+        for comp in props['B_comp']:
+            props['B_comp'][comp] = 0.0
+        assert lookup(*args) == expected
+
+
+class TestMembranePropertiesMcas:
+    """Test generic MCAS membrane properties."""
+
+    def test_divalent_b_below_monovalent(self):
+        """Brackish heuristics reject divalent ions more strongly."""
+        props = get_membrane_properties_mcas('brackish', None, ['Na_+', 'Cl_-', 'Ca_2+'])
+        assert props['B_comp']['Ca_2+'] < props['B_comp']['Na_+']
+
+    def test_custom_properties_bypass_cache(self):
+        """Custom B values are returned as given."""
+        custom = {'A_w': 1e-11, 'B_comp': {'Na_+': 1e-8}}
+        props = get_membrane_properties_mcas('brackish', custom, ['Na_+'])
+        assert props['B_comp'] == {'Na_+': 1e-8}
+        assert props['A_w'] == 1e-11
+
+    def test_seawater_b_values_by_ion_class(self):
+        """Seawater heuristics assign B by ion charge class."""
+        props = get_membrane_properties_mcas('seawater', None, ['Na_+', 'Mg_2+', 'HCO3_-'])
+        assert props['B_comp'] == {'Na_+': 1.0e-8, 'Mg_2+': 5.0e-9, 'HCO3_-': 8.0e-9}
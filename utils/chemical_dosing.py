@@ -15,6 +15,15 @@ from .scaling_prediction import get_scaling_severity
 
 logger = logging.getLogger(__name__)
 
+# pH adjustment chemicals: molar mass (g/mol), equivalents of H+/OH- per mole,
+# bulk cost and delivered concentration
+PH_ADJUSTMENT_CHEMICALS = {
+    'NaOH': {'mw': 40, 'equivalents': 1, 'cost_per_kg': 0.35, 'concentration': 0.5},  # 50% solution typical
+    'HCl': {'mw': 36.5, 'equivalents': 1, 'cost_per_kg': 0.20, 'concentration': 0.32},  # 32% solution typical
+    'H2SO4': {'mw': 98, 'equivalents': 2, 'cost_per_kg': 0.10, 'concentration': 0.93},  # 93% solution typical
+    'Ca(OH)2': {'mw': 74, 'equivalents': 2, 'cost_per_kg': 0.15, 'concentration': 1.0},  # Dry powder
+}
+
 
 class ChemicalDosingCalculator:
     """Calculate chemical dosing for RO systems."""
@@ -168,37 +177,11 @@ class ChemicalDosingCalculator:
         pH_change = abs(target_pH - current_pH)
         moles_per_L = pH_change * buffer_capacity / 1000
 
-        # Calculate dose based on chemical
-        chemical_doses = {
-            'NaOH': {
-                'dose_mg_L': moles_per_L * 40000,
-                'mw': 40,
-                'cost_per_kg': 0.35,
-                'concentration': 0.5  # 50% solution typical
-            },
-            'HCl': {
-                'dose_mg_L': moles_per_L * 36500,
-                'mw': 36.5,
-                'cost_per_kg': 0.20,
-                'concentration': 0.32  # 32% solution typical
-            },
-            'H2SO4': {
-                'dose_mg_L': moles_per_L * 49000,  # Provides 2 H+
-                'mw': 98,
-                'cost_per_kg': 0.10,
-                'concentration': 0.93  # 93% solution typical
-            },
-            'Ca(OH)2': {
-                'dose_mg_L': moles_per_L * 37000,  # Provides 2 OH-
-                'mw': 74,
-                'cost_per_kg': 0.15,
-                'concentration': 1.0  # Dry powder
-            }
-        }
-
-        chem_data = chemical_doses.get(chemical, chemical_doses['NaOH'])
+        # Calculate dose based on chemical (mg per mole of H+/OH- delivered)
+        chem_data = PH_ADJUSTMENT_CHEMICALS.get(chemical, PH_ADJUSTMENT_CHEMICALS['NaOH'])
+        mg_per_mol = chem_data['mw'] * 1000 / chem_data['equivalents']
 
-        dose_mg_L = chem_data['dose_mg_L']
+        dose_mg_L = moles_per_L * mg_per_mol
 
         # Calculate consumption
         daily_kg = dose_mg_L * feed_flow_m3h * 24 / 1000
@@ -196,10 +196,6 @@ class CIPSystemZOData(ZeroOrderBaseData):
         acid_kg_year = acid_cleanings * tank_volume_L * acid_concentration
         base_kg_year = base_cleanings * tank_volume_L * base_concentration
 
-        # Convert to kg/s for flow registration
-        acid_kg_s = acid_kg_year / (365 * 24 * 3600)
-        base_kg_s = base_kg_year / (365 * 24 * 3600)
-
         # Store chemical consumption for reporting (don't register flows yet)
         # The flows will be handled by the model builder if chemicals are configured
         blk.cip_acid_consumption_kg_year = pyo.Param(
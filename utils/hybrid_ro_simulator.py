@@ -6,6 +6,7 @@ by using industry-standard calculations for performance and WaterTAP only for ec
 """
 
 import logging
+import math
 from typing import Dict, Any, Optional
 from utils.stage_pressure_calculator import (
     calculate_required_feed_pressure,
@@ -19,6 +20,26 @@ from utils.membrane_properties_handler import get_membrane_properties_for_simula
 
 logger = logging.getLogger(__name__)
 
+# WaterTAP costing stack, resolved once at import rather than per economics call
+try:
+    from pyomo.environ import ConcreteModel, value
+    from idaes.core import FlowsheetBlock
+    from watertap.costing import WaterTAPCostingDetailed
+    from utils.mock_units_for_costing import (
+        create_mock_pump_costed,
+        create_mock_ro_costed,
+        create_mock_chemical_addition_costed,
+        create_mock_storage_tank_costed,
+        create_mock_cartridge_filter_costed
+    )
+    WATERTAP_COSTING_AVAILABLE = True
+    _WATERTAP_IMPORT_ERROR = None
+except Exception as e:
+    # Any failure loading the stack (not only ImportError) falls back to
+    # calculate_simple_economics rather than breaking this module's import
+    WATERTAP_COSTING_AVAILABLE = False
+    _WATERTAP_IMPORT_ERROR = e
+
 
 def calculate_blended_feed_composition(
     fresh_flow_m3h: float,
@@ -121,7 +142,7 @@ def simulate_ro_hybrid(
         'iterations': 0,
         'converged': True,
         'final_tolerance': 0.0,
-        'blended_feed_tds_mg_l': sum(feed_composition_mg_l.values())
+        'blended_feed_tds_mg_l': math.fsum(feed_composition_mg_l.values())
     }
 
     # For recycle cases, solve iteratively for steady-state composition
@@ -204,7 +225,7 @@ def simulate_ro_hybrid(
             recycle_convergence['iterations'] = iteration + 1
             recycle_convergence['final_tolerance'] = max_rel_change
             recycle_convergence['final_absolute_change'] = max_abs_change
-            recycle_convergence['blended_feed_tds_mg_l'] = sum(blended_feed_comp.values())
+            recycle_convergence['blended_feed_tds_mg_l'] = math.fsum(blended_feed_comp.values())
 
             # Check convergence
             if converged:
@@ -260,11 +281,12 @@ def simulate_ro_hybrid(
     # This is stored in configuration['system_feed_flow_m3h'] if recycle is used
     system_feed_flow = configuration.get('system_feed_flow_m3h',
                                          configuration.get('feed_flow_m3h', configuration['stages'][0]['feed_flow_m3h']))
+    total_permeate_flow = sum(stage_permeate_flows)
 
     results['system_performance'] = {
-        'total_permeate_flow_m3h': sum(stage_permeate_flows),
-        'system_recovery': sum(stage_permeate_flows) / system_feed_flow,
-        'mixed_permeate_tds_mg_l': sum(mixed_permeate.values()),
+        'total_permeate_flow_m3h': total_permeate_flow,
+        'system_recovery': total_permeate_flow / system_feed_flow,
+        'mixed_permeate_tds_mg_l': math.fsum(mixed_permeate.values()),
         'mixed_permeate_composition': mixed_permeate,
         'final_reject_tds_mg_l': results['stages'][-1]['reject_tds_mg_l'],
         'final_reject_flow_m3h': results['stages'][-1]['concentrate_flow_m3h']
@@ -280,7 +302,7 @@ def simulate_ro_hybrid(
     # Power consumption summary
     results['power_consumption'] = {
         'total_pump_power_kw': total_power_kw,
-        'specific_energy_kwh_m3': total_power_kw / sum(stage_permeate_flows),
+        'specific_energy_kwh_m3': total_power_kw / total_permeate_flow,
         'stage_breakdown': [s['pump_power_kw'] for s in results['stages']]
     }
 
@@ -292,7 +314,7 @@ def simulate_ro_hybrid(
         economics = calculate_watertap_economics(
             membrane_area_m2=configuration['total_membrane_area_m2'],
             pump_power_kw=total_power_kw,
-            permeate_flow_m3h=sum(stage_permeate_flows),
+            permeate_flow_m3h=total_permeate_flow,
             feed_pressure_bar=results['stages'][0]['feed_pressure_bar'],
             feed_flow_m3h=feed_flow_m3h,
             configuration=configuration,
@@ -403,9 +425,9 @@ def _calculate_stages(
             'stage_recovery': stage_config['stage_recovery'],
             'feed_pressure_bar': pressure_result['feed_pressure_bar'],
             'pressure_components': pressure_result['components'],
-            'feed_tds_mg_l': sum(current_feed_comp.values()),
-            'permeate_tds_mg_l': sum(permeate_comp.values()),
-            'reject_tds_mg_l': sum(reject_comp.values()),
+            'feed_tds_mg_l': math.fsum(current_feed_comp.values()),
+            'permeate_tds_mg_l': math.fsum(permeate_comp.values()),
+            'reject_tds_mg_l': math.fsum(reject_comp.values()),
             'pump_power_kw': stage_power_kw,
             'permeate_composition': permeate_comp,
             'reject_composition': reject_comp
@@ -489,6 +511,40 @@ def get_pump_efficiency(pressure_bar: float) -> float:
         return 0.80
 
 
+def _evaluate_unit_capex(unit) -> float:
+    """
+    Evaluate a mock unit's capital cost without solving the costing block.
+
+    WaterTAP creates constraints (capital_cost - cost_expr = 0) but doesn't solve.
+    The cost expression (args[1]) is negated to get the actual cost, and
+    capital_cost is fixed to it so downstream aggregation sees the same value.
+
+    Parameters
+    ----------
+    unit : Block
+        Unit with a ``costing`` sub-block
+
+    Returns
+    -------
+    float
+        Capital cost in the costing block's currency units
+    """
+    costing = unit.costing
+    try:
+        constraint_expr = costing.capital_cost_constraint.body
+    except AttributeError:
+        return value(costing.capital_cost)
+
+    # Constraint is: capital_cost - (TIC * cost * quantity) = 0
+    if len(constraint_expr.args) < 2:
+        return value(costing.capital_cost)
+
+    capex = -value(constraint_expr.args[1])
+    costing.capital_cost.fix(capex)
+    logger.debug(f"{unit.local_name} CAPEX from constraint: ${capex:,.0f}")
+    return capex
+
+
 def calculate_watertap_economics(
     membrane_area_m2: float,
     pump_power_kw: float,
@@ -531,18 +587,13 @@ def calculate_watertap_economics(
     dict
         Economic results with WaterTAP CAPEX and simple OPEX estimates
     """
-    try:
-        from pyomo.environ import ConcreteModel, value
-        from idaes.core import FlowsheetBlock
-        from watertap.costing import WaterTAPCostingDetailed
-        from utils.mock_units_for_costing import (
-            create_mock_pump_costed,
-            create_mock_ro_costed,
-            create_mock_chemical_addition_costed,
-            create_mock_storage_tank_costed,
-            create_mock_cartridge_filter_costed
+    if not WATERTAP_COSTING_AVAILABLE:
+        logger.warning(f"WaterTAP not available, using fallback economics: {_WATERTAP_IMPORT_ERROR}")
+        return calculate_simple_economics(
+            membrane_area_m2, pump_power_kw, permeate_flow_m3h
         )
 
+    try:
         # Create model with flowsheet
         m = ConcreteModel()
         m.fs = FlowsheetBlock(dynamic=False)
@@ -573,31 +624,8 @@ def calculate_watertap_economics(
         )
 
         # Evaluate capital cost constraints to get actual values
-        # WaterTAP creates constraints (capital_cost - cost_expr = 0) but doesn't solve
-        # We extract the cost expression (args[1]) and negate it to get actual cost
-        if hasattr(pump.costing, 'capital_cost_constraint'):
-            constraint_expr = pump.costing.capital_cost_constraint.body
-            # Constraint is: capital_cost - (TIC * cost * quantity) = 0
-            # args[1] is the negative cost expression, so negate it
-            if len(constraint_expr.args) >= 2:
-                pump_capex = -value(constraint_expr.args[1])
-                pump.costing.capital_cost.fix(pump_capex)
-                logger.debug(f"Pump CAPEX from constraint: ${pump_capex:,.0f}")
-            else:
-                pump_capex = value(pump.costing.capital_cost)
-        else:
-            pump_capex = value(pump.costing.capital_cost)
-
-        if hasattr(ro.costing, 'capital_cost_constraint'):
-            constraint_expr = ro.costing.capital_cost_constraint.body
-            if len(constraint_expr.args) >= 2:
-                membrane_capex = -value(constraint_expr.args[1])
-                ro.costing.capital_cost.fix(membrane_capex)
-                logger.debug(f"RO CAPEX from constraint: ${membrane_capex:,.0f}")
-            else:
-                membrane_capex = value(ro.costing.capital_cost)
-        else:
-            membrane_capex = value(ro.costing.capital_cost)
+        pump_capex = _evaluate_unit_capex(pump)
+        membrane_capex = _evaluate_unit_capex(ro)
 
         # Initialize ancillary equipment tracking
         ancillary_capex = 0
@@ -616,15 +644,7 @@ def calculate_watertap_economics(
                 flow_m3h=flow_for_filter,
                 costing_block=m.fs.costing
             )
-            if hasattr(main_filter.costing, 'capital_cost_constraint'):
-                constraint_expr = main_filter.costing.capital_cost_constraint.body
-                if len(constraint_expr.args) >= 2:
-                    filter_capex = -value(constraint_expr.args[1])
-                    main_filter.costing.capital_cost.fix(filter_capex)
-                else:
-                    filter_capex = value(main_filter.costing.capital_cost)
-            else:
-                filter_capex = value(main_filter.costing.capital_cost)
+            filter_capex = _evaluate_unit_capex(main_filter)
             ancillary_capex += filter_capex
             equipment_details['main_cartridge_filter'] = {'capex': filter_capex}
             logger.info(f"Main cartridge filter CAPEX: ${filter_capex:,.0f}")
@@ -653,15 +673,7 @@ def calculate_watertap_economics(
                 volume_m3=cip_tank_volume_m3,
                 costing_block=m.fs.costing
             )
-            if hasattr(cip_tank.costing, 'capital_cost_constraint'):
-                constraint_expr = cip_tank.costing.capital_cost_constraint.body
-                if len(constraint_expr.args) >= 2:
-                    tank_capex = -value(constraint_expr.args[1])
-                    cip_tank.costing.capital_cost.fix(tank_capex)
-                else:
-                    tank_capex = value(cip_tank.costing.capital_cost)
-            else:
-                tank_capex = value(cip_tank.costing.capital_cost)
+            tank_capex = _evaluate_unit_capex(cip_tank)
             ancillary_capex += tank_capex
             logger.info(f"CIP tank CAPEX: ${tank_capex:,.0f}")
 
@@ -680,15 +692,7 @@ def calculate_watertap_economics(
                 costing_block=m.fs.costing,
                 flow_m3h=cip_flow_m3h
             )
-            if hasattr(cip_pump.costing, 'capital_cost_constraint'):
-                constraint_expr = cip_pump.costing.capital_cost_constraint.body
-                if len(constraint_expr.args) >= 2:
-                    cip_pump_capex = -value(constraint_expr.args[1])
-                    cip_pump.costing.capital_cost.fix(cip_pump_capex)
-                else:
-                    cip_pump_capex = value(cip_pump.costing.capital_cost)
-            else:
-                cip_pump_capex = value(cip_pump.costing.capital_cost)
+            cip_pump_capex = _evaluate_unit_capex(cip_pump)
             ancillary_capex += cip_pump_capex
             logger.info(f"CIP pump CAPEX: ${cip_pump_capex:,.0f}")
 
@@ -699,15 +703,7 @@ def calculate_watertap_economics(
                 flow_m3h=cip_flow_m3h,
                 costing_block=m.fs.costing
             )
-            if hasattr(cip_filter.costing, 'capital_cost_constraint'):
-                constraint_expr = cip_filter.costing.capital_cost_constraint.body
-                if len(constraint_expr.args) >= 2:
-                    cip_filter_capex = -value(constraint_expr.args[1])
-                    cip_filter.costing.capital_cost.fix(cip_filter_capex)
-                else:
-                    cip_filter_capex = value(cip_filter.costing.capital_cost)
-            else:
-                cip_filter_capex = value(cip_filter.costing.capital_cost)
+            cip_filter_capex = _evaluate_unit_capex(cip_filter)
             ancillary_capex += cip_filter_capex
             logger.info(f"CIP cartridge filter CAPEX: ${cip_filter_capex:,.0f}")
 
@@ -738,15 +734,7 @@ def calculate_watertap_economics(
                             costing_block=m.fs.costing,
                             chemical_type='anti_scalant'
                         )
-                        if hasattr(antiscalant.costing, 'capital_cost_constraint'):
-                            constraint_expr = antiscalant.costing.capital_cost_constraint.body
-                            if len(constraint_expr.args) >= 2:
-                                chem_capex = -value(constraint_expr.args[1])
-                                antiscalant.costing.capital_cost.fix(chem_capex)
-                            else:
-                                chem_capex = value(antiscalant.costing.capital_cost)
-                        else:
-                            chem_capex = value(antiscalant.costing.capital_cost)
+                        chem_capex = _evaluate_unit_capex(antiscalant)
                         ancillary_capex += chem_capex
 
                         # Chemical storage tank (14-day supply)
@@ -758,15 +746,7 @@ def calculate_watertap_economics(
                             volume_m3=storage_volume_m3,
                             costing_block=m.fs.costing
                         )
-                        if hasattr(chem_tank.costing, 'capital_cost_constraint'):
-                            constraint_expr = chem_tank.costing.capital_cost_constraint.body
-                            if len(constraint_expr.args) >= 2:
-                                chem_tank_capex = -value(constraint_expr.args[1])
-                                chem_tank.costing.capital_cost.fix(chem_tank_capex)
-                            else:
-                                chem_tank_capex = value(chem_tank.costing.capital_cost)
-                        else:
-                            chem_tank_capex = value(chem_tank.costing.capital_cost)
+                        chem_tank_capex = _evaluate_unit_capex(chem_tank)
                         ancillary_capex += chem_tank_capex
 
                         equipment_details['chemical_dosing'] = {
@@ -781,9 +761,6 @@ def calculate_watertap_economics(
 
             logger.info(f"Total ancillary equipment CAPEX: ${ancillary_capex:,.0f}")
 
-        # Aggregate capital costs (no LCOW calculation needed)
-        m.fs.costing.cost_process()
-
         # Extract CAPEX - sum individual costs since total_capital_cost needs solving
         total_capex = pump_capex + membrane_capex + ancillary_capex
 
@@ -826,11 +803,6 @@ def calculate_watertap_economics(
 
         return economics
 
-    except ImportError as e:
-        logger.warning(f"WaterTAP not available, using fallback economics: {e}")
-        return calculate_simple_economics(
-            membrane_area_m2, pump_power_kw, permeate_flow_m3h
-        )
     except Exception as e:
         logger.error(f"WaterTAP CAPEX calculation failed: {e}")
         import traceback
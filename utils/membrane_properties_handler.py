@@ -8,13 +8,37 @@ This module provides functions to handle membrane properties from different sour
 """
 
 from typing import Dict, Optional, Tuple, List
+import copy
 import logging
+from functools import lru_cache
 import yaml
 from pathlib import Path
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Ion classes used to assign heuristic B values (both MCAS and plain notation)
+ION_CHARGE_CLASS = {
+    'Na_+': 'monovalent', 'Cl_-': 'monovalent', 'Na+': 'monovalent', 'Cl-': 'monovalent',
+    'Ca_2+': 'divalent', 'Mg_2+': 'divalent', 'SO4_2-': 'divalent',
+    'Ca2+': 'divalent', 'Mg2+': 'divalent', 'SO4-2': 'divalent',
+}
+
+
+def _solute_key(solute_list: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    """Hashable cache key for an optional solute list."""
+    return tuple(solute_list) if solute_list else None
+
+
+def _cached_copy(cached_lookup, *key):
+    """
+    Return a deep copy of an lru_cache'd lookup result.
+
+    The cached lookups below return nested dicts; callers get their own copy
+    so mutating a result never alters what later calls receive.
+    """
+    return copy.deepcopy(cached_lookup(*key))
+
 
 def normalize_membrane_name(membrane_model: str) -> str:
     """
@@ -144,41 +168,62 @@ def get_membrane_properties_mcas(
     Returns:
         Dict with 'A_w' and 'B_comp' (dict of B values by component)
     """
+    if membrane_properties is None:
+        # Heuristic values depend only on the membrane type and solutes
+        return _cached_copy(
+            _get_membrane_properties_mcas_cached, membrane_type, _solute_key(solute_list)
+        )
+
     # Get base A_w value
     A_w, B_s_default = get_membrane_properties(membrane_type, membrane_properties)
     
     # If custom properties provided with ion-specific B values
-    if membrane_properties and 'B_comp' in membrane_properties:
+    if 'B_comp' in membrane_properties:
         return {
             'A_w': membrane_properties.get('A_w', A_w),
             'B_comp': membrane_properties['B_comp']
         }
     
-    # Otherwise, use heuristics for ion-specific B values
-    B_comp = {}
-    
+    return _ion_specific_b_values(membrane_type, A_w, B_s_default, solute_list)
+
+
+@lru_cache(maxsize=32)
+def _get_membrane_properties_mcas_cached(
+    membrane_type: str,
+    solute_list: Optional[Tuple[str, ...]]
+) -> Dict[str, Dict[str, float]]:
+    """Cached heuristic lookup backing get_membrane_properties_mcas."""
+    A_w, B_s_default = get_membrane_properties(membrane_type, None)
+    return _ion_specific_b_values(membrane_type, A_w, B_s_default, solute_list)
+
+
+def _ion_specific_b_values(
+    membrane_type: str,
+    A_w: float,
+    B_s_default: float,
+    solute_list
+) -> Dict[str, Dict[str, float]]:
+    """Build ion-specific B values from the generic salt permeability."""
     if not solute_list:
         # Default for NaCl only
         return {'A_w': A_w, 'B_comp': {'Na_+': B_s_default, 'Cl_-': B_s_default}}
     
     # Set B values based on ion type and membrane type
-    for ion in solute_list:
-        if membrane_type == 'seawater' or 'sea' in membrane_type.lower():
-            # Seawater membranes - tighter, lower B values
-            if ion in ['Na_+', 'Cl_-', 'Na+', 'Cl-']:
-                B_comp[ion] = 1.0e-8  # m/s
-            elif ion in ['Ca_2+', 'Mg_2+', 'SO4_2-', 'Ca2+', 'Mg2+', 'SO4-2']:
-                B_comp[ion] = 5.0e-9  # m/s - higher rejection for divalent
-            else:
-                B_comp[ion] = 8.0e-9  # m/s - default
-        else:
-            # Brackish water membranes - looser, higher B values
-            if ion in ['Na_+', 'Cl_-', 'Na+', 'Cl-']:
-                B_comp[ion] = B_s_default  # Use default from config
-            elif ion in ['Ca_2+', 'Mg_2+', 'SO4_2-', 'Ca2+', 'Mg2+', 'SO4-2']:
-                B_comp[ion] = B_s_default * 0.4  # Better rejection for divalent
-            else:
-                B_comp[ion] = B_s_default * 0.7  # Moderate rejection
+    if membrane_type == 'seawater' or 'sea' in membrane_type.lower():
+        # Seawater membranes - tighter, lower B values (m/s);
+        # higher rejection for divalent ions
+        B_by_class = {'monovalent': 1.0e-8, 'divalent': 5.0e-9}
+        B_other = 8.0e-9
+    else:
+        # Brackish water membranes - looser, higher B values scaled from config
+        # default; better rejection for divalent, moderate for others
+        B_by_class = {'monovalent': B_s_default, 'divalent': B_s_default * 0.4}
+        B_other = B_s_default * 0.7
+
+    B_comp = {
+        ion: B_by_class.get(ION_CHARGE_CLASS.get(ion), B_other)
+        for ion in solute_list
+    }
     
     logger.info(f"Generated ion-specific B values for {membrane_type}: {B_comp}")
     
@@ -229,6 +274,18 @@ def get_membrane_from_catalog(
     Returns:
         Dict with A_w, B_comp, and physical properties
     """
+    return _cached_copy(
+        _get_membrane_from_catalog_cached, membrane_model, _solute_key(solute_list), temperature_K
+    )
+
+
+@lru_cache(maxsize=64)
+def _get_membrane_from_catalog_cached(
+    membrane_model: str,
+    solute_list: Optional[Tuple[str, ...]],
+    temperature_K: float
+) -> Dict:
+    """Cached catalog lookup backing get_membrane_from_catalog."""
     catalog = load_membrane_catalog()
     spacer_profiles = load_spacer_profiles()
 
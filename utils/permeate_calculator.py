@@ -11,6 +11,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Base rejections at 25°C (typical values from literature)
+DEFAULT_ION_REJECTIONS = {
+    'Na+': 0.985,      # Monovalent cations
+    'K+': 0.985,
+    'NH4+': 0.98,
+    'Cl-': 0.985,      # Monovalent anions
+    'NO3-': 0.93,
+    'HCO3-': 0.95,
+    'Ca+2': 0.99,      # Divalent cations
+    'Mg+2': 0.99,
+    'Ba+2': 0.99,
+    'Sr+2': 0.99,
+    'SO4-2': 0.998,    # Divalent anions
+    'CO3-2': 0.995,
+    'SiO2': 0.97,      # Silica
+    'B': 0.70,         # Boron (low rejection)
+}
+
 
 def calculate_stage_permeate_concentration(
     stage_feed_conc_mg_l: dict,
@@ -51,6 +69,13 @@ def calculate_stage_permeate_concentration(
     # Using stage-specific recovery
     concentration_factor = 1 / (1 - stage_recovery)
 
+    # With reject = feed * CF, the log-mean (reject - feed) / ln(reject / feed)
+    # reduces to feed * (CF - 1) / ln(CF), so the log is the same for every ion
+    log_mean_factor = (
+        (concentration_factor - 1) / math.log(concentration_factor)
+        if concentration_factor > 1 else 1.0
+    )
+
     for ion, feed_conc in stage_feed_conc_mg_l.items():
         # Get ion-specific rejection (or default)
         rejection = get_ion_rejection(ion, membrane_properties, temperature_c)
@@ -61,7 +86,7 @@ def calculate_stage_permeate_concentration(
 
         # Calculate log-mean concentration between stage feed and reject
         if abs(reject_conc[ion] - feed_conc) > 0.01:  # Avoid division by zero
-            c_lm = (reject_conc[ion] - feed_conc) / math.log(reject_conc[ion] / feed_conc)
+            c_lm = feed_conc * log_mean_factor
         else:
             c_lm = feed_conc
 
@@ -105,30 +130,12 @@ def get_ion_rejection(
     float
         Rejection coefficient (0-1)
     """
-    # Base rejections at 25°C (typical values from literature)
-    default_rejections = {
-        'Na+': 0.985,      # Monovalent cations
-        'K+': 0.985,
-        'NH4+': 0.98,
-        'Cl-': 0.985,      # Monovalent anions
-        'NO3-': 0.93,
-        'HCO3-': 0.95,
-        'Ca+2': 0.99,      # Divalent cations
-        'Mg+2': 0.99,
-        'Ba+2': 0.99,
-        'Sr+2': 0.99,
-        'SO4-2': 0.998,    # Divalent anions
-        'CO3-2': 0.995,
-        'SiO2': 0.97,      # Silica
-        'B': 0.70,         # Boron (low rejection)
-    }
-
     # Check for specific rejection in membrane properties
     specific_key = f'rejection_{ion}'
     if specific_key in membrane_properties:
         base_rejection = membrane_properties[specific_key]
-    elif ion in default_rejections:
-        base_rejection = default_rejections[ion]
+    elif ion in DEFAULT_ION_REJECTIONS:
+        base_rejection = DEFAULT_ION_REJECTIONS[ion]
     else:
         # Default for unknown ions
         logger.warning(f"Unknown ion {ion}, using default rejection 0.98")
@@ -163,23 +170,18 @@ def calculate_stage_mixed_permeate(
         Mixed permeate ion concentrations (mg/L)
     """
     total_flow = sum(stage_permeate_flows)
-    mixed_conc = {}
 
-    # Get all ions present
-    all_ions = set()
-    for conc_dict in stage_permeate_concentrations:
-        all_ions.update(conc_dict.keys())
+    # Accumulate each ion's mass flow in a single pass over the stages
+    total_mass = {}
+    for flow, conc_dict in zip(stage_permeate_flows, stage_permeate_concentrations):
+        for ion, conc in conc_dict.items():
+            total_mass[ion] = total_mass.get(ion, 0) + flow * conc
 
-    # Calculate flow-weighted average for each ion
-    for ion in all_ions:
-        total_mass = 0
-        for flow, conc_dict in zip(stage_permeate_flows, stage_permeate_concentrations):
-            if ion in conc_dict:
-                total_mass += flow * conc_dict[ion]
-
-        mixed_conc[ion] = total_mass / total_flow if total_flow > 0 else 0
-
-    return mixed_conc
+    # Flow-weighted average for each ion
+    return {
+        ion: mass / total_flow if total_flow > 0 else 0
+        for ion, mass in total_mass.items()
+    }
 
 
 def estimate_permeate_tds(
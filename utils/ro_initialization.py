@@ -6,6 +6,8 @@ FBBT (Feasibility-Based Bound Tightening) infeasibility by ensuring
 pressure variables are properly set before initialization.
 """
 
+import math
+import time
 from typing import Dict, Any, Optional
 from pyomo.environ import value, units as pyunits
 from idaes.core.util.initialization import propagate_state
@@ -30,17 +32,19 @@ def get_stream_tds_ppm(stream_state) -> float:
         # Get property package from parent block
         property_package = stream_state.parent_block().config.property_package
         
-        h2o_flow = value(stream_state.flow_mass_phase_comp[0, 'Liq', 'H2O'])
+        # Resolve the port reference once rather than per component
+        flow = stream_state.flow_mass_phase_comp
+        h2o_flow = value(flow[0, 'Liq', 'H2O'])
         
         if hasattr(property_package, 'solute_set'):
             # MCAS package
             tds_flow = sum(
-                value(stream_state.flow_mass_phase_comp[0, 'Liq', comp])
+                value(flow[0, 'Liq', comp])
                 for comp in property_package.solute_set
             )
         else:
             # Standard package
-            tds_flow = value(stream_state.flow_mass_phase_comp[0, 'Liq', 'TDS'])
+            tds_flow = value(flow[0, 'Liq', 'TDS'])
         
         total_flow = h2o_flow + tds_flow
         return (tds_flow / total_flow) * 1e6 if total_flow > 0 else 0
@@ -244,9 +248,6 @@ def initialize_pump_with_pressure(
         required_pressure: Required outlet pressure in Pa
         efficiency: Pump efficiency (default 0.8)
     """
-    import time
-    from watertap.core.solvers import get_solver
-    
     pump_start = time.time()
     
     # Fix pressure for stable initialization - try without pyunits again for debugging
@@ -260,12 +261,13 @@ def initialize_pump_with_pressure(
     # Initialize pump with state args to avoid bound issues
     # Check property package type by examining the inlet state block
     inlet_params = pump.control_volume.properties_in[0].params
+    inlet_flow = pump.inlet.flow_mass_phase_comp
     if hasattr(inlet_params, 'solute_set'):
         # MCAS - include all components
         inlet_state = {
             'flow_mass_phase_comp': {
-                ('Liq', comp): value(pump.inlet.flow_mass_phase_comp[0, 'Liq', comp])
-                for comp in ['H2O'] + list(inlet_params.solute_set)
+                ('Liq', comp): value(inlet_flow[0, 'Liq', comp])
+                for comp in inlet_params.component_list  # H2O plus all solutes
             },
             'temperature': value(pump.inlet.temperature[0]),
             'pressure': required_pressure  # Use required pressure to avoid bound conflicts
@@ -274,8 +276,8 @@ def initialize_pump_with_pressure(
         # Standard package with TDS
         inlet_state = {
             'flow_mass_phase_comp': {
-                ('Liq', 'H2O'): value(pump.inlet.flow_mass_phase_comp[0, 'Liq', 'H2O']),
-                ('Liq', 'TDS'): value(pump.inlet.flow_mass_phase_comp[0, 'Liq', 'TDS'])
+                ('Liq', 'H2O'): value(inlet_flow[0, 'Liq', 'H2O']),
+                ('Liq', 'TDS'): value(inlet_flow[0, 'Liq', 'TDS'])
             },
             'temperature': value(pump.inlet.temperature[0]),
             'pressure': required_pressure  # Use required pressure to avoid bound conflicts
@@ -283,19 +285,20 @@ def initialize_pump_with_pressure(
     
     # === PASS 1: Quick feasibility solve (5-10s) ===
     logger.info(f"[PUMP TIMING] Starting Pass 1 (feasibility) at {time.time()-pump_start:.1f}s")
-    pump.initialize(
-        state_args=inlet_state,
-        outlvl=idaeslog.NOTSET,  # Suppress solver output
-        optarg={
-            'tol': 1e-3,  # Relaxed tolerance for quick feasibility
-            'constr_viol_tol': 1e-3,
-            'acceptable_tol': 1e-2,
-            'acceptable_constr_viol_tol': 1e-2,
-            'max_cpu_time': 15,  # Quick pass - 15s max
-            'max_iter': 30,      # Fewer iterations for speed
-            'print_level': 0
-        }
-    )
+    with redirect_stdout_to_stderr():
+        pump.initialize(
+            state_args=inlet_state,
+            outlvl=idaeslog.NOTSET,  # Suppress solver output
+            optarg={
+                'tol': 1e-3,  # Relaxed tolerance for quick feasibility
+                'constr_viol_tol': 1e-3,
+                'acceptable_tol': 1e-2,
+                'acceptable_constr_viol_tol': 1e-2,
+                'max_cpu_time': 15,  # Quick pass - 15s max
+                'max_iter': 30,      # Fewer iterations for speed
+                'print_level': 0
+            }
+        )
     logger.info(f"[PUMP TIMING] Pass 1 completed at {time.time()-pump_start:.1f}s")
     
     # === PASS 2: Warm-start refinement (optional, only if needed) ===
@@ -321,16 +324,15 @@ def initialize_ro_unit_elegant(
         target_recovery: Optional target recovery for initial guess
         verbose: Print detailed initialization info
     """
-    import time as timing
-    ro_start = timing.time()
+    ro_start = time.time()
     
     # Get inlet conditions (must be already propagated)
-    time = 0  # Steady state
+    t = 0  # Steady state
     inlet = ro_unit.inlet
     
     # Extract inlet state
-    inlet_pressure = value(inlet.pressure[time])
-    inlet_temp = value(inlet.temperature[time])
+    inlet_pressure = value(inlet.pressure[t])
+    inlet_temp = value(inlet.temperature[t])
     
     # Get component flows - handle both mass and molar basis
     flow_basis = 'mass' if hasattr(inlet, 'flow_mass_phase_comp') else 'mol'
@@ -340,23 +342,24 @@ def initialize_ro_unit_elegant(
     
     if flow_basis == 'mass':
         inlet_flows = {
-            comp: value(inlet.flow_mass_phase_comp[time, 'Liq', comp])
+            comp: value(inlet.flow_mass_phase_comp[t, 'Liq', comp])
             for comp in prop_params.component_list
         }
         # Calculate TDS for osmotic pressure check
         h2o_flow = inlet_flows.get('H2O', 0)
         tds_flow = sum(v for k, v in inlet_flows.items() if k != 'H2O')
         if h2o_flow > 0:
-            feed_tds_ppm = (tds_flow / (h2o_flow + tds_flow)) * 1e6
+            tds_mass_frac = tds_flow / (h2o_flow + tds_flow)
+            feed_tds_ppm = tds_mass_frac * 1e6
             # Add debug logging
             logger.debug(f"TDS calculation (mass basis): h2o_flow={h2o_flow:.6f} kg/s, tds_flow={tds_flow:.6f} kg/s")
-            logger.debug(f"Mass fraction: {tds_flow / (h2o_flow + tds_flow):.6f}, TDS ppm: {feed_tds_ppm:.0f}")
+            logger.debug(f"Mass fraction: {tds_mass_frac:.6f}, TDS ppm: {feed_tds_ppm:.0f}")
         else:
             feed_tds_ppm = 0
     else:
         # Molar basis - need molecular weights
         inlet_flows_mol = {
-            comp: value(inlet.flow_mol_phase_comp[time, 'Liq', comp])
+            comp: value(inlet.flow_mol_phase_comp[t, 'Liq', comp])
             for comp in prop_params.component_list
         }
         # Convert to mass for TDS calculation
@@ -373,7 +376,7 @@ def initialize_ro_unit_elegant(
             feed_tds_ppm = 0
     
     # Check if pressure is sufficient
-    permeate_pressure = value(ro_unit.permeate.pressure[time]) if hasattr(ro_unit.permeate.pressure[time], 'value') else 101325
+    permeate_pressure = value(ro_unit.permeate.pressure[t]) if hasattr(ro_unit.permeate.pressure[t], 'value') else 101325
     feed_osmotic = calculate_osmotic_pressure(feed_tds_ppm)
     min_required = permeate_pressure + feed_osmotic + 5e5  # 5 bar minimum driving
     
@@ -451,6 +454,7 @@ def initialize_ro_unit_elegant(
                 guess_candidates.append(g)
         
         last_error = None
+        flux_h2o_vars = None  # Water flux VarData, fetched on first failure
         for idx, recovery_guess in enumerate(guess_candidates, start=1):
             # Provide initialization guesses to avoid FBBT issues
             # Use mild CP for the first attempt; reduce CP if retries are needed
@@ -472,17 +476,18 @@ def initialize_ro_unit_elegant(
             try:
                 logger.info(
                     f"[RO TIMING] Attempt {idx}: initialize() with recovery_guess={recovery_guess:.2f}, "
-                    f"cp_modulus={cp_guess:.2f} at {timing.time()-ro_start:.1f}s"
-                )
-                ro_unit.initialize(
-                    state_args=state_args,
-                    initialize_guess=initialize_guess,
-                    optarg=init_options,
-                    outlvl=idaeslog.NOTSET  # Suppress solver output
+                    f"cp_modulus={cp_guess:.2f} at {time.time()-ro_start:.1f}s"
                 )
+                with redirect_stdout_to_stderr():
+                    ro_unit.initialize(
+                        state_args=state_args,
+                        initialize_guess=initialize_guess,
+                        optarg=init_options,
+                        outlvl=idaeslog.NOTSET  # Suppress solver output
+                    )
                 logger.info(
                     f"[RO TIMING] ro_unit.initialize() succeeded on attempt {idx} "
-                    f"at {timing.time()-ro_start:.1f}s"
+                    f"at {time.time()-ro_start:.1f}s"
                 )
                 break
             except Exception as e:
@@ -492,12 +497,18 @@ def initialize_ro_unit_elegant(
                 )
                 # On failure, try next, possibly with a more permissive flux lower bound if available
                 try:
-                    if hasattr(ro_unit, 'feed_side') and hasattr(ro_unit, 'flux_mass_phase_comp'):
+                    if (flux_h2o_vars is None and hasattr(ro_unit, 'feed_side')
+                            and hasattr(ro_unit, 'flux_mass_phase_comp')):
                         # Relax the water flux lower bound further to avoid FBBT over-tightening
-                        # Use 0.0 LMH (fully non-negative) for maximum permissiveness
+                        # Use 0.0 LMH (fully non-negative) for maximum permissiveness.
+                        # The bound persists across retries, so this only runs once.
                         jw_min_relaxed = 0.0
-                        for x in ro_unit.feed_side.length_domain:
-                            ro_unit.flux_mass_phase_comp[0, x, 'Liq', 'H2O'].setlb(jw_min_relaxed)
+                        flux_h2o_vars = [
+                            ro_unit.flux_mass_phase_comp[0, x, 'Liq', 'H2O']
+                            for x in ro_unit.feed_side.length_domain
+                        ]
+                        for flux_var in flux_h2o_vars:
+                            flux_var.setlb(jw_min_relaxed)
                         logger.info("Relaxed water flux lower bound to 0.00 LMH for next attempt")
                 except Exception as _e:
                     logger.debug(f"Could not relax flux lower bound: {_e}")
@@ -506,21 +517,22 @@ def initialize_ro_unit_elegant(
             raise last_error if last_error else RuntimeError("RO initialize failed for unknown reasons")
     else:
         # Standard initialization for non-MCAS with output suppressed
-        logger.info(f"[RO TIMING] About to call ro_unit.initialize() (standard) at {timing.time()-ro_start:.1f}s")
-        ro_unit.initialize(
-            state_args=state_args,
-            optarg=init_options,
-            outlvl=idaeslog.NOTSET  # Suppress solver output
-        )
-        logger.info(f"[RO TIMING] ro_unit.initialize() completed at {timing.time()-ro_start:.1f}s")
+        logger.info(f"[RO TIMING] About to call ro_unit.initialize() (standard) at {time.time()-ro_start:.1f}s")
+        with redirect_stdout_to_stderr():
+            ro_unit.initialize(
+                state_args=state_args,
+                optarg=init_options,
+                outlvl=idaeslog.NOTSET  # Suppress solver output
+            )
+        logger.info(f"[RO TIMING] ro_unit.initialize() completed at {time.time()-ro_start:.1f}s")
     
     if verbose:
         # Report actual recovery achieved
         if flow_basis == 'mass':
-            perm_h2o = value(ro_unit.permeate.flow_mass_phase_comp[time, 'Liq', 'H2O'])
+            perm_h2o = value(ro_unit.permeate.flow_mass_phase_comp[t, 'Liq', 'H2O'])
             feed_h2o = inlet_flows.get('H2O', 0)
         else:
-            perm_h2o = value(ro_unit.permeate.flow_mol_phase_comp[time, 'Liq', 'H2O'])
+            perm_h2o = value(ro_unit.permeate.flow_mol_phase_comp[t, 'Liq', 'H2O'])
             feed_h2o = inlet_flows_mol.get('H2O', 0)
         
         if feed_h2o > 0:
@@ -554,10 +566,11 @@ def initialize_multistage_ro_elegant(
     
     # Check if using MCAS (multiple ions) or standard (TDS)
     if hasattr(model.fs.properties, 'solute_set'):
-        # MCAS - sum all ion flows
-        feed_tds_kg_s = 0
-        for comp in model.fs.properties.solute_set:
-            feed_tds_kg_s += value(model.fs.feed.outlet.flow_mass_phase_comp[0, 'Liq', comp])
+        # MCAS - sum all ion flows (fsum keeps trace ions from being rounded away)
+        feed_flow = model.fs.feed.outlet.flow_mass_phase_comp
+        feed_tds_kg_s = math.fsum(
+            value(feed_flow[0, 'Liq', comp]) for comp in model.fs.properties.solute_set
+        )
     else:
         # Standard property package with TDS
         feed_tds_kg_s = value(model.fs.feed.outlet.flow_mass_phase_comp[0, 'Liq', 'TDS'])
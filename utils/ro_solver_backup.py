@@ -7,12 +7,14 @@ using various initialization strategies.
 
 from typing import Dict, Any, Optional
 import logging
+import math
+import re
 import sys
 import warnings
 import time
 from pyomo.environ import (
     Constraint, TerminationCondition, value, Block, Var, units as pyunits,
-    Objective, minimize, Param, RangeSet, NonNegativeReals
+    Objective, minimize, Param, RangeSet, NonNegativeReals, quicksum
 )
 from pyomo.opt import SolverStatus
 from idaes.core.util.scaling import calculate_scaling_factors
@@ -48,6 +50,38 @@ from .logging_config import get_configured_logger
 from .stdout_redirect import redirect_stdout_to_stderr
 logger = get_configured_logger(__name__)
 
+# Atmospheric pressure in Pa, converted once at import rather than per call
+ATM_PA = value(pyunits.convert(1 * pyunits.atm, to_units=pyunits.Pa))
+
+# Fallback pump outlet pressures for sequential initialization (stage 1, 2, 3+);
+# later stages need more pressure due to concentration
+SEQUENTIAL_INIT_PRESSURES = (15 * pyunits.bar, 25 * pyunits.bar, 35 * pyunits.bar)
+
+# Minimum-pressure hint in the errors raised by ro_initialization
+# ("... Need at least X bar for ..."), used to retry with a higher pressure
+MIN_PRESSURE_PATTERN = re.compile(r"Need at least ([\d.]+) bar")
+
+# IPOPT options for the initialization solves (CP-off, CP-on, direct and verification)
+IPOPT_INIT_OPTIONS = {
+    'linear_solver': 'ma27',
+    'max_cpu_time': 300,
+    'tol': 1e-5,
+    'constr_viol_tol': 1e-5,
+    'print_level': 0
+}
+
+# IPOPT options for the main (Phase 1) solve, with or without recycle
+IPOPT_MAIN_OPTIONS = {
+    'linear_solver': 'ma27',
+    'max_cpu_time': 600,  # 10 minutes for main solve
+    'tol': 1e-6,  # Moderately relaxed for balance of speed/accuracy
+    'constr_viol_tol': 1e-6,
+    'acceptable_tol': 1e-3,  # Fallback for difficult problems
+    'acceptable_constr_viol_tol': 1e-3,
+    'print_level': 0,  # Suppress all IPOPT output
+    'halt_on_ampl_error': 'yes'  # Stop immediately on AMPL error
+}
+
 # Import interval_initializer for FBBT robustness
 try:
     from watertap.core.util.initialization import interval_initializer
@@ -62,6 +96,19 @@ except ImportError:
     logger.warning("interval_initializer not available - FBBT robustness reduced")
 
 
+def _resolve_arc(fs, description, *names):
+    """
+    Return the first arc on the flowsheet matching one of the naming conventions.
+
+    Raises AttributeError naming every candidate if none exists.
+    """
+    for name in names:
+        arc = getattr(fs, name, None)
+        if arc is not None:
+            return arc
+    raise AttributeError(f"Flowsheet missing {description} (tried {', '.join(names)})")
+
+
 def deactivate_cp_equations(model, n_stages):
     """
     Temporarily deactivate concentration polarization equations to avoid FBBT issues.
@@ -76,10 +123,13 @@ def deactivate_cp_equations(model, n_stages):
     deactivated = []
     for i in range(1, n_stages + 1):
         ro = getattr(model.fs, f"ro_stage{i}")
-        if hasattr(ro.feed_side, 'eq_concentration_polarization'):
-            ro.feed_side.eq_concentration_polarization.deactivate()
-            deactivated.append(ro.feed_side.eq_concentration_polarization)
-            logger.info(f"Stage {i}: Deactivated concentration polarization equations")
+        try:
+            cp_eq = ro.feed_side.eq_concentration_polarization
+        except AttributeError:
+            continue
+        cp_eq.deactivate()
+        deactivated.append(cp_eq)
+        logger.info(f"Stage {i}: Deactivated concentration polarization equations")
     return deactivated
 
 
@@ -144,6 +194,7 @@ def check_solver_status(results, context="solve", raise_on_fail=True, m=None, n_
 
         if m and n_stages:
             # Diagnostic output for AMPL errors
+            solutes = None  # read lazily, inside the guarded per-stage block
             for i in range(1, n_stages + 1):
                 try:
                     pump = getattr(m.fs, f"pump{i}")
@@ -154,20 +205,26 @@ def check_solver_status(results, context="solve", raise_on_fail=True, m=None, n_
                     logger.error(f"Stage {i} feed pressure: {feed_pressure/1e5:.2f} bar")
 
                     # Check for problematic concentrations
+                    feed_props = ro.feed_side.properties
                     for x in ro.feed_side.length_domain:
-                        if hasattr(ro.feed_side.properties[0, x], 'conc_mass_phase_comp'):
-                            for comp in m.fs.properties.solute_set:
-                                try:
-                                    conc = value(ro.feed_side.properties[0, x].conc_mass_phase_comp['Liq', comp])
-                                    if conc <= 0 or conc > 1000:  # kg/m³
-                                        logger.error(f"Stage {i} problematic {comp} concentration at x={x}: {conc:.3e} kg/m³")
-                                except:
-                                    logger.error(f"Stage {i} could not evaluate concentration for {comp} at x={x}")
+                        try:
+                            conc_mass = feed_props[0, x].conc_mass_phase_comp
+                        except AttributeError:
+                            continue
+                        if solutes is None:
+                            solutes = tuple(getattr(m.fs.properties, 'solute_set', ()))
+                        for comp in solutes:
+                            try:
+                                conc = value(conc_mass['Liq', comp])
+                                if conc <= 0 or conc > 1000:  # kg/m³
+                                    logger.error(f"Stage {i} problematic {comp} concentration at x={x}: {conc:.3e} kg/m³")
+                            except:
+                                logger.error(f"Stage {i} could not evaluate concentration for {comp} at x={x}")
 
                     # Check osmotic vs feed pressure
                     if hasattr(ro, 'feed_side'):
                         try:
-                            osmotic_in = value(ro.feed_side.properties[0, 0].pressure_osm_phase['Liq'])
+                            osmotic_in = value(feed_props[0, 0].pressure_osm_phase['Liq'])
                             delta_p = feed_pressure - osmotic_in
                             logger.error(f"Stage {i} ΔP - Δπ = {delta_p/1e5:.2f} bar (must be positive)")
                             if delta_p < 0:
@@ -217,19 +274,23 @@ def fast_mass_balance_mixer(m, config_data):
     
     # Get fresh feed state
     fresh_feed = m.fs.fresh_feed.outlet
-    fresh_h2o = value(fresh_feed.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-    fresh_tds = sum(value(fresh_feed.flow_mass_phase_comp[0, 'Liq', comp])
-                    for comp in m.fs.properties.solute_set)
+    mixer_flow = m.fs.feed_mixer.outlet.flow_mass_phase_comp
+    solutes = tuple(m.fs.properties.solute_set)
+    # Read every fresh-feed component flow once; reused for totals and the split
+    fresh_flows = {
+        comp: value(fresh_feed.flow_mass_phase_comp[0, 'Liq', comp])
+        for comp in m.fs.properties.component_list
+    }
+    fresh_h2o = fresh_flows['H2O']
+    fresh_tds = math.fsum(fresh_flows[comp] for comp in solutes)
     fresh_total = fresh_h2o + fresh_tds
     feed_tds_ppm = (fresh_tds / fresh_total) * 1e6
     
     if not has_recycle or recycle_flow_m3h == 0:
         # Non-recycle: Direct copy
         logger.info("Non-recycle case - direct feed propagation")
-        for comp in m.fs.properties.component_list:
-            m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp].set_value(
-                value(fresh_feed.flow_mass_phase_comp[0, 'Liq', comp])
-            )
+        for comp, flow in fresh_flows.items():
+            mixer_flow[0, 'Liq', comp].set_value(flow)
     else:
         # Recycle case: Mass balance with intelligent initial guess
         logger.info(f"Recycle case - mass balance with {recycle_flow_m3h:.2f} m³/h recycle")
@@ -257,16 +318,16 @@ def fast_mass_balance_mixer(m, config_data):
         logger.info(f"Mixed feed TDS: {mixed_tds_ppm:.0f} ppm")
 
         # Set mixer outlet - H2O
-        m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', 'H2O'].set_value(mixed_h2o)
+        mixer_flow[0, 'Liq', 'H2O'].set_value(mixed_h2o)
 
         # Distribute TDS among components proportionally to feed composition
-        for comp in m.fs.properties.solute_set:
-            fresh_comp_flow = value(fresh_feed.flow_mass_phase_comp[0, 'Liq', comp])
+        for comp in solutes:
+            fresh_comp_flow = fresh_flows[comp]
             comp_fraction = fresh_comp_flow / fresh_tds if fresh_tds > 0 else 0
 
             # Mixed component = fresh component + recycle component
             mixed_comp_flow = fresh_comp_flow + (recycle_tds * comp_fraction)
-            m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp].set_value(mixed_comp_flow)
+            mixer_flow[0, 'Liq', comp].set_value(mixed_comp_flow)
     
     # Set temperature and pressure (same as feed)
     m.fs.feed_mixer.outlet.temperature[0].set_value(value(fresh_feed.temperature[0]))
@@ -276,7 +337,7 @@ def fast_mass_balance_mixer(m, config_data):
     # Add try-catch to identify AMPL errors
     try:
         # Check total flow is reasonable before touching mass fractions
-        total_flow = sum(value(m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp])
+        total_flow = sum(value(mixer_flow[0, 'Liq', comp])
                         for comp in m.fs.properties.component_list)
         logger.info(f"Mixer outlet total flow: {total_flow:.4f} kg/s")
 
@@ -292,7 +353,7 @@ def fast_mass_balance_mixer(m, config_data):
 
         # Log component flows for debugging
         for comp in m.fs.properties.component_list:
-            flow_val = value(m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp])
+            flow_val = value(mixer_flow[0, 'Liq', comp])
             logger.error(f"  {comp}: {flow_val:.4e} kg/s")
 
         # Check inlet flows
@@ -329,9 +390,6 @@ def initialize_erd_if_present(m, n_stages):
         m: Pyomo model
         n_stages: Number of RO stages
     """
-    from pyomo.environ import value
-    from pyomo.environ import units as pyunits
-    
     if not hasattr(m.fs, "erd"):
         # No ERD; use the standard arc
         propagate_state(arc=m.fs.final_conc_to_split)
@@ -353,22 +411,25 @@ def initialize_erd_if_present(m, n_stages):
         )
     
     # Low pressure and sensible temperature
-    feed_src.pressure[0].set_value(pyunits.convert(1*pyunits.atm, to_units=pyunits.Pa))
+    feed_src.pressure[0].set_value(ATM_PA)
     feed_src.temperature[0].set_value(value(m.fs.fresh_feed.outlet.temperature[0]))
     
     # Initialize feed source
-    m.fs.erd_feed_source.initialize(outlvl=idaeslog.NOTSET)
+    with redirect_stdout_to_stderr():
+        m.fs.erd_feed_source.initialize(outlvl=idaeslog.NOTSET)
     
     # Push feed state into ERD
     propagate_state(arc=m.fs.erd_feed_to_erd)
     
     # Initialize ERD
-    m.fs.erd.initialize(outlvl=idaeslog.NOTSET)
+    with redirect_stdout_to_stderr():
+        m.fs.erd.initialize(outlvl=idaeslog.NOTSET)
     
     # Propagate ERD outlets forward
     propagate_state(arc=m.fs.erd_to_split)
     propagate_state(arc=m.fs.erd_out_to_product)
-    m.fs.erd_product.initialize(outlvl=idaeslog.NOTSET)
+    with redirect_stdout_to_stderr():
+        m.fs.erd_product.initialize(outlvl=idaeslog.NOTSET)
     
     logger.info("ERD initialization complete")
 
@@ -378,7 +439,13 @@ def refine_recycle_composition(m, config_data, iteration=1):
     Optional: Refine mixer outlet based on actual concentrate composition.
     Usually not needed as initial guess is quite accurate.
     """
-    if not config_data.get('recycle_info', {}).get('uses_recycle', False):
+    recycle_info = config_data.get('recycle_info', {})
+    if not recycle_info.get('uses_recycle', False):
+        return
+    # With no recycle flow the mixer outlet is a copy of the fresh feed
+    # (see fast_mass_balance_mixer), so there is nothing to refine
+    recycle_flow_m3h = recycle_info.get('recycle_flow_m3h', 0)
+    if recycle_flow_m3h <= 0:
         return
     
     logger.info(f"Refining recycle composition (iteration {iteration})")
@@ -387,29 +454,31 @@ def refine_recycle_composition(m, config_data, iteration=1):
     n_stages = config_data.get('n_stages', config_data.get('stage_count', 1))
     last_stage = n_stages
     concentrate = getattr(m.fs, f'ro_stage{last_stage}').retentate
+    solutes = tuple(m.fs.properties.solute_set)
+    mixer_flow = m.fs.feed_mixer.outlet.flow_mass_phase_comp
     
     # Calculate actual concentrate composition
     conc_h2o = value(concentrate.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-    conc_tds = sum(value(concentrate.flow_mass_phase_comp[0, 'Liq', comp]) 
-                   for comp in m.fs.properties.solute_set)
+    conc_flows = {comp: value(concentrate.flow_mass_phase_comp[0, 'Liq', comp])
+                  for comp in solutes}
+    conc_tds = math.fsum(conc_flows.values())
     actual_conc_tds_ppm = (conc_tds / (conc_h2o + conc_tds)) * 1e6
     
     logger.info(f"Actual concentrate TDS: {actual_conc_tds_ppm:.0f} ppm")
     
     # Only refine if difference is significant (>5%)
-    current_mixed_h2o = value(m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-    current_mixed_tds = sum(value(m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp])
-                           for comp in m.fs.properties.solute_set)
+    current_mixed_h2o = value(mixer_flow[0, 'Liq', 'H2O'])
+    current_mixed_tds = math.fsum(value(mixer_flow[0, 'Liq', comp]) for comp in solutes)
     current_mixed_tds_ppm = (current_mixed_tds / (current_mixed_h2o + current_mixed_tds)) * 1e6
     
     # Calculate expected mixed TDS with actual concentrate
-    recycle_flow_m3h = config_data['recycle_info']['recycle_flow_m3h']
     recycle_mass_flow = recycle_flow_m3h / 3.6
     
     fresh_feed = m.fs.fresh_feed.outlet
     fresh_h2o = value(fresh_feed.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-    fresh_tds = sum(value(fresh_feed.flow_mass_phase_comp[0, 'Liq', comp]) 
-                    for comp in m.fs.properties.solute_set)
+    fresh_flows = {comp: value(fresh_feed.flow_mass_phase_comp[0, 'Liq', comp])
+                   for comp in solutes}
+    fresh_tds = math.fsum(fresh_flows.values())
     
     # Recalculate with actual concentrate composition
     actual_recycle_tds_fraction = conc_tds / (conc_h2o + conc_tds)
@@ -426,19 +495,14 @@ def refine_recycle_composition(m, config_data, iteration=1):
                    f"refined {refined_mixed_tds_ppm:.0f} ppm ({error_percent:.1f}% error)")
         
         # Update mixer outlet
-        m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', 'H2O'].set_value(
-            fresh_h2o + recycle_h2o
-        )
+        mixer_flow[0, 'Liq', 'H2O'].set_value(fresh_h2o + recycle_h2o)
         
         # Update components based on actual concentrate ratios
-        for comp in m.fs.properties.solute_set:
-            fresh_comp = value(fresh_feed.flow_mass_phase_comp[0, 'Liq', comp])
-            conc_comp = value(concentrate.flow_mass_phase_comp[0, 'Liq', comp])
-            comp_fraction = conc_comp / conc_tds if conc_tds > 0 else 0
+        # (reuses the flows already read for the TDS totals above)
+        for comp in solutes:
+            comp_fraction = conc_flows[comp] / conc_tds if conc_tds > 0 else 0
             
-            m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp].set_value(
-                fresh_comp + recycle_tds * comp_fraction
-            )
+            mixer_flow[0, 'Liq', comp].set_value(fresh_flows[comp] + recycle_tds * comp_fraction)
     else:
         logger.info(f"Initial guess was accurate ({error_percent:.1f}% error) - no refinement needed")
 
@@ -460,6 +524,12 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         
         m = model
         n_stages = config_data.get('n_stages', config_data.get('stage_count', 1))
+        # Stage and pump blocks, looked up once for the per-stage loops below
+        ro_stages = [getattr(m.fs, f"ro_stage{i}") for i in range(1, n_stages + 1)]
+        pumps = [getattr(m.fs, f"pump{i}") for i in range(1, n_stages + 1)]
+        # Materialize the property sets once instead of re-walking them per loop
+        solutes = tuple(m.fs.properties.solute_set)
+        component_list = tuple(m.fs.properties.component_list)
         
         # Check for recycle
         recycle_info = config_data.get('recycle_info', {})
@@ -492,9 +562,12 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             logger.info("Note: Using 'feed' attribute - consider updating to 'fresh_feed' in future")
         else:
             raise AttributeError("Flowsheet missing inlet feed stream (expected 'fresh_feed' or 'feed')")
-        # Initialize feed with output suppressed
+        # Initialize feed with output suppressed. Unit initialize() calls in this
+        # function run under redirect_stdout_to_stderr so Python-level prints
+        # cannot reach the MCP stdout channel
         logger.info(f"[TIMING {time.time()-start_time:.1f}s] Starting feed initialization")
-        feed_blk.initialize(outlvl=idaeslog.NOTSET)
+        with redirect_stdout_to_stderr():
+            feed_blk.initialize(outlvl=idaeslog.NOTSET)
         logger.info(f"[TIMING {time.time()-start_time:.1f}s] Feed initialized")
         
         # Fast mixer initialization using mass balance
@@ -515,8 +588,8 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
 
                 # Get fresh feed values
                 fresh_h2o = value(m.fs.feed_mixer.fresh.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-                fresh_tds = sum(value(m.fs.feed_mixer.fresh.flow_mass_phase_comp[0, 'Liq', comp])
-                               for comp in m.fs.properties.solute_set)
+                fresh_tds = math.fsum(value(m.fs.feed_mixer.fresh.flow_mass_phase_comp[0, 'Liq', comp])
+                                     for comp in solutes)
                 fresh_total = fresh_h2o + fresh_tds
                 feed_tds_ppm = (fresh_tds / fresh_total) * 1e6 if fresh_total > 0 else 5000
 
@@ -535,9 +608,9 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 m.fs.feed_mixer.recycle.flow_mass_phase_comp[0, 'Liq', 'H2O'].set_value(recycle_h2o)
 
                 # Distribute TDS proportionally
-                for comp in m.fs.properties.solute_set:
+                for comp in solutes:
                     fresh_comp = value(m.fs.feed_mixer.fresh.flow_mass_phase_comp[0, 'Liq', comp])
-                    comp_fraction = fresh_comp / fresh_tds if fresh_tds > 0 else 1.0 / len(m.fs.properties.solute_set)
+                    comp_fraction = fresh_comp / fresh_tds if fresh_tds > 0 else 1.0 / len(solutes)
                     m.fs.feed_mixer.recycle.flow_mass_phase_comp[0, 'Liq', comp].set_value(
                         recycle_tds * comp_fraction
                     )
@@ -554,7 +627,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                            f"TDS ≈ {concentrate_tds_ppm:.0f} ppm")
             else:
                 # Zero recycle flow
-                for comp in m.fs.properties.component_list:
+                for comp in component_list:
                     m.fs.feed_mixer.recycle.flow_mass_phase_comp[0, 'Liq', comp].set_value(0)
                 m.fs.feed_mixer.recycle.temperature[0].set_value(298.15)
                 m.fs.feed_mixer.recycle.pressure[0].set_value(101325)
@@ -571,8 +644,8 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         
         # Log the mixer outlet
         mixer_h2o = value(m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-        mixer_tds = sum(value(m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp]) 
-                       for comp in m.fs.properties.solute_set)
+        mixer_tds = math.fsum(value(m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp]) 
+                             for comp in solutes)
         mixer_tds_ppm = (mixer_tds / (mixer_h2o + mixer_tds)) * 1e6 if (mixer_h2o + mixer_tds) > 0 else 0
         logger.info(f"Mixer outlet: H2O={mixer_h2o:.4f} kg/s, TDS={mixer_tds:.6f} kg/s, TDS={mixer_tds_ppm:.0f} ppm")
         
@@ -590,12 +663,9 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         else:
             raise AttributeError("Flowsheet missing inlet feed stream")
         
-        feed_flows = {}
-        for comp in m.fs.properties.solute_set | {'H2O'}:
-            feed_flows[comp] = value(feed_outlet.flow_mass_phase_comp[0, 'Liq', comp])
-        
-        h2o_flow = feed_flows['H2O']
-        tds_flow = sum(v for k, v in feed_flows.items() if k != 'H2O')
+        feed_flow_comp = feed_outlet.flow_mass_phase_comp
+        h2o_flow = value(feed_flow_comp[0, 'Liq', 'H2O'])
+        tds_flow = math.fsum(value(feed_flow_comp[0, 'Liq', comp]) for comp in solutes)
         feed_tds_ppm = (tds_flow / (h2o_flow + tds_flow)) * 1e6
         
         logger.info(f"Feed TDS: {feed_tds_ppm:.0f} ppm")
@@ -629,6 +699,16 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             # Non-recycle: mixer TDS equals feed TDS
             current_tds_ppm = feed_tds_ppm
             logger.info(f"Using feed TDS for Stage 1: {current_tds_ppm:.0f} ppm (no recycle)")
+
+        # Feed TDS of each stage, walked once through the configured recoveries:
+        # stage i is fed by the concentrate of stage i-1
+        stage_feed_tds_ppm = [current_tds_ppm]
+        for stage_cfg in config_data['stages'][:n_stages - 1]:
+            stage_feed_tds_ppm.append(calculate_concentrate_tds(
+                stage_feed_tds_ppm[-1],
+                stage_cfg.get('stage_recovery', 0.5),
+                salt_passage=default_salt_passage
+            ))
         
         # Apply scaling factors once after at least the first pump is initialized
         scaling_applied = False
@@ -636,26 +716,16 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         for i in range(1, n_stages + 1):
             logger.info(f"[TIMING {time.time()-start_time:.1f}s] --- Stage {i} ---")
 
-            pump = getattr(m.fs, f"pump{i}")
-            ro = getattr(m.fs, f"ro_stage{i}")
+            pump = pumps[i - 1]
+            ro = ro_stages[i - 1]
 
             # Get stage recovery target
             stage_data = config_data['stages'][i-1]
             target_recovery = stage_data.get('stage_recovery', 0.5)
 
-            # For downstream stages, calculate actual concentrate TDS from previous stage
+            # For downstream stages, use the previous stage's concentrate TDS
+            current_tds_ppm = stage_feed_tds_ppm[i - 1]
             if i > 1:
-                # Calculate actual TDS from previous stage concentrate
-                prev_stage_recovery = config_data['stages'][i-2].get('stage_recovery', 0.5)
-                prev_stage_salt_passage = default_salt_passage
-
-                # Update TDS based on previous stage concentration
-                prev_concentrate_tds = calculate_concentrate_tds(
-                    current_tds_ppm,
-                    prev_stage_recovery,
-                    salt_passage=prev_stage_salt_passage
-                )
-                current_tds_ppm = prev_concentrate_tds
                 logger.info(f"Stage {i}: Updated TDS from Stage {i-1} concentrate: {current_tds_ppm:.0f} ppm")
 
             # Propagate to pump (already done for stage 1)
@@ -670,17 +740,14 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             # Get feed flow to this stage
             if i == 1:
                 # First stage - use mixer outlet
-                feed_flow = value(sum(
-                    m.fs.feed_mixer.outlet.flow_mass_phase_comp[0, 'Liq', comp]
-                    for comp in m.fs.properties.component_list
-                ))
+                feed_port = m.fs.feed_mixer.outlet
             else:
                 # Later stages - use previous stage concentrate
-                prev_ro = getattr(m.fs, f"ro_stage{i-1}")
-                feed_flow = value(sum(
-                    prev_ro.retentate.flow_mass_phase_comp[0, 'Liq', comp]
-                    for comp in m.fs.properties.component_list
-                ))
+                feed_port = ro_stages[i - 2].retentate
+            feed_flow = math.fsum(
+                value(feed_port.flow_mass_phase_comp[0, 'Liq', comp])
+                for comp in component_list
+            )
             
             configured_pressure_bar = stage_data.get('feed_pressure_bar')
 
@@ -756,8 +823,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 error_msg = str(e)
                 if "Inlet pressure" in error_msg and "too low" in error_msg:
                     # Extract minimum pressure from error message
-                    import re
-                    match = re.search(r"Need at least ([\d.]+) bar", error_msg)
+                    match = MIN_PRESSURE_PATTERN.search(error_msg)
                     if match:
                         min_pressure_bar = float(match.group(1))
                         retry_pressure = min_pressure_bar * 1.2e5  # Convert to Pa with 20% safety margin
@@ -774,7 +840,6 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             # This ensures proper pressure values exist for scaling calculations
             if not scaling_applied and i == 1:
                 try:
-                    from idaes.core.util.scaling import calculate_scaling_factors
                     logger.info(f"[TIMING {time.time()-start_time:.1f}s] Applying scaling factors after pump1 initialization")
                     calculate_scaling_factors(m)
                     scaling_applied = True
@@ -783,14 +848,11 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                     logger.warning(f"Could not calculate scaling factors: {_e}")
 
             # Propagate to RO (handle both arc naming conventions)
-            arc_name_stage = f"pump{i}_to_ro_stage{i}"
-            arc_name_simple = f"pump{i}_to_ro{i}"
-            if hasattr(m.fs, arc_name_stage):
-                propagate_state(arc=getattr(m.fs, arc_name_stage))
-            elif hasattr(m.fs, arc_name_simple):
-                propagate_state(arc=getattr(m.fs, arc_name_simple))
-            else:
-                raise AttributeError(f"Flowsheet missing pump to RO arc for stage {i} (tried {arc_name_stage} and {arc_name_simple})")
+            pump_to_ro_arc = _resolve_arc(
+                m.fs, f"pump to RO arc for stage {i}",
+                f"pump{i}_to_ro_stage{i}", f"pump{i}_to_ro{i}"
+            )
+            propagate_state(arc=pump_to_ro_arc)
             
             # Apply interval_initializer for FBBT robustness before RO initialization
             # For high-TDS stages or later stages, interval FBBT can over-tighten bounds and hurt convergence.
@@ -814,31 +876,39 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             
             # Touch RO properties to ensure trace components are built
             # Access properties through the actual property blocks
-            if hasattr(ro.feed_side, 'properties'):
+            try:
+                feed_props = ro.feed_side.properties
+            except AttributeError:
+                feed_props = None
+            if feed_props is not None:
                 # For membrane models, properties are indexed by position and time
+                length_points = tuple(ro.feed_side.length_domain)
                 for t in ro.flowsheet().time:
-                    for x in ro.feed_side.length_domain:
-                        if hasattr(ro.feed_side.properties[t, x], 'mass_frac_phase_comp'):
+                    for x in length_points:
+                        try:
                             # Touch the variable to ensure it's built
-                            ro.feed_side.properties[t, x].mass_frac_phase_comp
+                            feed_props[t, x].mass_frac_phase_comp
+                        except AttributeError:
+                            pass
             
             # Touch inlet-side properties to ensure they're built (helps FBBT)
             # Do NOT delete MCAS charge_balance constraints; they are required for electroneutrality
             if hasattr(ro.feed_side, 'properties_in'):
                 inlet_prop = ro.feed_side.properties_in[0]
-                try:
-                    if hasattr(inlet_prop, 'mass_frac_phase_comp'):
-                        _ = inlet_prop.mass_frac_phase_comp
-                    if hasattr(inlet_prop, 'conc_mass_phase_comp'):
-                        _ = inlet_prop.conc_mass_phase_comp
-                except Exception:
-                    pass  # Properties might not be needed
-                # Log DOF to verify we're not over/under-constrained
-                try:
-                    dof = degrees_of_freedom(inlet_prop)
-                    logger.info(f"Stage {i}: RO inlet DOF = {dof}")
-                except Exception:
-                    pass
+                # A single access builds the on-demand property; no hasattr pre-check
+                for prop_name in ('mass_frac_phase_comp', 'conc_mass_phase_comp'):
+                    try:
+                        getattr(inlet_prop, prop_name)
+                    except Exception:
+                        pass  # Properties might not be needed
+                # Log DOF to verify we're not over/under-constrained; the
+                # block walk is only worth doing when the message is emitted
+                if logger.isEnabledFor(logging.INFO):
+                    try:
+                        dof = degrees_of_freedom(inlet_prop)
+                        logger.info(f"Stage {i}: RO inlet DOF = {dof}")
+                    except Exception:
+                        pass
             
             # Initialize RO with elegant approach, with a fallback relaxation for robustness
             logger.info(f"[TIMING {time.time()-start_time:.1f}s] Starting RO{i} initialization")
@@ -859,8 +929,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 # If the failure is due to insufficient inlet pressure, parse and bump pump pressure
                 err_msg = str(e_init)
                 if "Inlet pressure" in err_msg and "Need at least" in err_msg:
-                    import re
-                    match = re.search(r"Need at least ([\d.]+) bar", err_msg)
+                    match = MIN_PRESSURE_PATTERN.search(err_msg)
                     if match:
                         min_bar = float(match.group(1))
                         new_pressure = min(80.0, min_bar * 1.25)  # 25% margin, cap at 80 bar
@@ -870,10 +939,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                         # Set new pump pressure and re-propagate
                         pump.outlet.pressure[0].fix(new_pressure * 1e5)
                         # Re-propagate into RO
-                        if hasattr(m.fs, arc_name_stage):
-                            propagate_state(arc=getattr(m.fs, arc_name_stage))
-                        elif hasattr(m.fs, arc_name_simple):
-                            propagate_state(arc=getattr(m.fs, arc_name_simple))
+                        propagate_state(arc=pump_to_ro_arc)
                         # Retry initialization
                         initialize_ro_unit_elegant(ro, target_recovery, verbose=True)
                         logger.info(f"[TIMING {time.time()-start_time:.1f}s] RO{i} initialized after pressure bump")
@@ -921,34 +987,28 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             # Propagate permeate to product (handle both arc naming conventions)
             if i == 1:
                 # First stage has different naming patterns
-                if hasattr(m.fs, "ro_stage1_perm_to_prod"):
-                    propagate_state(arc=m.fs.ro_stage1_perm_to_prod)
-                elif hasattr(m.fs, "ro1_perm_to_prod"):
-                    propagate_state(arc=m.fs.ro1_perm_to_prod)
-                else:
-                    raise AttributeError(f"Flowsheet missing permeate arc for stage 1")
+                perm_arc_names = ("ro_stage1_perm_to_prod", "ro1_perm_to_prod")
             else:
                 # Later stages
-                arc_name_stage = f"ro_stage{i}_perm_to_prod{i}"
-                arc_name_simple = f"ro{i}_perm_to_prod{i}"
-                if hasattr(m.fs, arc_name_stage):
-                    propagate_state(arc=getattr(m.fs, arc_name_stage))
-                elif hasattr(m.fs, arc_name_simple):
-                    propagate_state(arc=getattr(m.fs, arc_name_simple))
-                else:
-                    raise AttributeError(f"Flowsheet missing permeate arc for stage {i}")
+                perm_arc_names = (f"ro_stage{i}_perm_to_prod{i}", f"ro{i}_perm_to_prod{i}")
+            propagate_state(
+                arc=_resolve_arc(m.fs, f"permeate arc for stage {i}", *perm_arc_names)
+            )
             
-            getattr(m.fs, f"stage_product{i}").initialize(outlvl=idaeslog.NOTSET)
+            with redirect_stdout_to_stderr():
+                getattr(m.fs, f"stage_product{i}").initialize(outlvl=idaeslog.NOTSET)
         
         # Complete initialization of recycle components if present
         if has_recycle:
             # Initialize recycle splitter and disposal
             final_stage = n_stages
             initialize_erd_if_present(m, n_stages)
-            m.fs.recycle_split.initialize(outlvl=idaeslog.NOTSET)
+            with redirect_stdout_to_stderr():
+                m.fs.recycle_split.initialize(outlvl=idaeslog.NOTSET)
             
             propagate_state(arc=m.fs.split_to_disposal)
-            m.fs.disposal_product.initialize(outlvl=idaeslog.NOTSET)
+            with redirect_stdout_to_stderr():
+                m.fs.disposal_product.initialize(outlvl=idaeslog.NOTSET)
             
             # Calculate recycle split fraction from recycle ratio
             # recycle_ratio = recycle_flow / fresh_feed_flow
@@ -967,7 +1027,8 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             m.fs.recycle_split.split_fraction[0, "recycle"].fix(recycle_split_fraction)
             
             # Re-initialize splitter
-            m.fs.recycle_split.initialize(outlvl=idaeslog.NOTSET)
+            with redirect_stdout_to_stderr():
+                m.fs.recycle_split.initialize(outlvl=idaeslog.NOTSET)
             
             # Optional: Refine mixer composition based on actual concentrate
             if config_data.get('refine_recycle', True):
@@ -976,27 +1037,30 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             # Initialize disposal product for non-recycle case (unified architecture)
             final_stage = n_stages
             initialize_erd_if_present(m, n_stages)
-            m.fs.recycle_split.initialize(outlvl=idaeslog.NOTSET)
+            with redirect_stdout_to_stderr():
+                m.fs.recycle_split.initialize(outlvl=idaeslog.NOTSET)
             
             propagate_state(arc=m.fs.split_to_disposal)
-            m.fs.disposal_product.initialize(outlvl=idaeslog.NOTSET)
+            with redirect_stdout_to_stderr():
+                m.fs.disposal_product.initialize(outlvl=idaeslog.NOTSET)
         
         # Apply scaling factors NOW after pumps are initialized with proper pressures
         # This ensures positive Net Driving Pressure (NDP) before FBBT runs
         logger.info("\n=== Applying Scaling Factors ===")
         logger.info("Calculating scaling factors with initialized pump pressures...")
-        from idaes.core.util.scaling import calculate_scaling_factors
         calculate_scaling_factors(m)
         logger.info("Scaling factors applied successfully")
         
-        # Check initial solution
-        logger.info("\n=== Checking Initial Solution ===")
-        for i in range(1, n_stages + 1):
-            ro = getattr(m.fs, f"ro_stage{i}")
-            h2o_in = value(ro.inlet.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-            h2o_perm = value(ro.permeate.flow_mass_phase_comp[0, 'Liq', 'H2O'])
-            recovery = h2o_perm / h2o_in if h2o_in > 0 else 0
-            logger.info(f"Stage {i} initial recovery: {recovery:.3f}")
+        # Check initial solution (report only, one log record for all stages)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n=== Checking Initial Solution ===")
+            stage_recoveries = []
+            for i, ro in enumerate(ro_stages, start=1):
+                h2o_in = value(ro.inlet.flow_mass_phase_comp[0, 'Liq', 'H2O'])
+                h2o_perm = value(ro.permeate.flow_mass_phase_comp[0, 'Liq', 'H2O'])
+                recovery = h2o_perm / h2o_in if h2o_in > 0 else 0
+                stage_recoveries.append(f"Stage {i}: {recovery:.3f}")
+            logger.info(f"Initial recoveries: {', '.join(stage_recoveries)}")
         
         # Two-stage initialization: First solve with CP deactivated, then reactivate
         logger.info("\n=== Stage 1: Initial Solve with CP Deactivated ===")
@@ -1007,13 +1071,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         
         if deactivated_cp:
             logger.info(f"[TIMING {time.time()-start_time:.1f}s] Initial solve without CP constraints...")
-            results = solver.solve(m, tee=False, options={
-                'linear_solver': 'ma27',
-                'max_cpu_time': 300,
-                'tol': 1e-5,
-                'constr_viol_tol': 1e-5,
-                'print_level': 0
-            })
+            results = solver.solve(m, tee=False, options=IPOPT_INIT_OPTIONS)
             logger.info(f"[TIMING {time.time()-start_time:.1f}s] Initial solve completed")
             
             if not check_solver_status(results, context="Stage 1 (no CP)", raise_on_fail=False):
@@ -1024,51 +1082,36 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             reactivate_cp_equations(deactivated_cp)
             
             logger.info(f"[TIMING {time.time()-start_time:.1f}s] Solving with CP constraints...")
-            results = solver.solve(m, tee=False, options={
-                'linear_solver': 'ma27',
-                'max_cpu_time': 300,
-                'tol': 1e-5,
-                'constr_viol_tol': 1e-5,
-                'print_level': 0
-            })
+            results = solver.solve(m, tee=False, options=IPOPT_INIT_OPTIONS)
             logger.info(f"[TIMING {time.time()-start_time:.1f}s] Stage 2 solve completed")
             
-            if not check_solver_status(results, context="Stage 2 (with CP)", raise_on_fail=False):
+            initial_solve_optimal = check_solver_status(results, context="Stage 2 (with CP)", raise_on_fail=False)
+            if not initial_solve_optimal:
                 logger.warning("Stage 2 solve not optimal, but proceeding...")
         else:
             # No CP equations to deactivate, solve directly
             logger.info("No CP equations found, solving directly...")
-            results = solver.solve(m, tee=False, options={
-                'linear_solver': 'ma27',
-                'max_cpu_time': 300,
-                'tol': 1e-5,
-                'constr_viol_tol': 1e-5,
-                'print_level': 0
-            })
-            if not check_solver_status(results, context="Initial solve", raise_on_fail=False):
+            results = solver.solve(m, tee=False, options=IPOPT_INIT_OPTIONS)
+            initial_solve_optimal = check_solver_status(results, context="Initial solve", raise_on_fail=False)
+            if not initial_solve_optimal:
                 logger.warning("Initial solve not optimal, but proceeding...")
         
         # If optimize_pumps, unfix pumps and add recovery constraints
         if optimize_pumps:
             logger.info("\n=== Setting up Pump Optimization ===")
             
-            # First verify we have a feasible initial solution
-            # Get solver (no parameters to get_solver)
-            solver = get_solver()
-            
-            logger.info(f"[TIMING {time.time()-start_time:.1f}s] Verifying initial solution...")
-            logger.info(f"[TIMING {time.time()-start_time:.1f}s] About to call solver.solve() for verification")
-            results = solver.solve(m, tee=False, options={
-                'linear_solver': 'ma27',
-                'max_cpu_time': 300,  # 5 minutes for verification
-                'tol': 1e-5,  # Relaxed for faster convergence
-                'constr_viol_tol': 1e-5,
-                'print_level': 0  # Suppress all IPOPT output
-            })
-            logger.info(f"[TIMING {time.time()-start_time:.1f}s] solver.solve() verification completed")
-            
-            if not check_solver_status(results, context="Initial verification", raise_on_fail=False):
-                logger.warning("Initial solution not optimal, but proceeding with pump optimization...")
+            # First verify we have a feasible initial solution. Nothing has
+            # changed since the solve above, so only re-solve if it fell short.
+            if initial_solve_optimal:
+                logger.info("Initial solution already optimal - skipping verification solve")
+            else:
+                logger.info(f"[TIMING {time.time()-start_time:.1f}s] Verifying initial solution...")
+                logger.info(f"[TIMING {time.time()-start_time:.1f}s] About to call solver.solve() for verification")
+                results = solver.solve(m, tee=False, options=IPOPT_INIT_OPTIONS)
+                logger.info(f"[TIMING {time.time()-start_time:.1f}s] solver.solve() verification completed")
+
+                if not check_solver_status(results, context="Initial verification", raise_on_fail=False):
+                    logger.warning("Initial solution not optimal, but proceeding with pump optimization...")
             
             # Now unfix pumps and add recovery constraints
             membrane_type_cfg = config_data.get('membrane_type', getattr(m, 'membrane_type', 'brackish'))
@@ -1077,7 +1120,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
             if is_seawater_case:
                 # Unfix all pump pressures
                 for i in range(1, n_stages + 1):
-                    pump = getattr(m.fs, f"pump{i}")
+                    pump = pumps[i - 1]
                     pump.outlet.pressure[0].unfix()
                     logger.info(f"Stage {i}: Unfixed pump pressure (was {value(pump.outlet.pressure[0])/1e5:.1f} bar)")
 
@@ -1125,9 +1168,9 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 system_tol = 0.05  # Allow 5% tolerance for seawater systems
 
                 feed_h2o = m.fs.fresh_feed.properties[0].flow_mass_phase_comp['Liq', 'H2O']
-                total_perm_h2o = sum(
-                    getattr(m.fs, f"ro_stage{i}").mixed_permeate[0].flow_mass_phase_comp['Liq', 'H2O']
-                    for i in range(1, n_stages + 1)
+                total_perm_h2o = quicksum(
+                    ro_blk.mixed_permeate[0].flow_mass_phase_comp['Liq', 'H2O']
+                    for ro_blk in ro_stages
                 )
 
                 setattr(m.fs, 'system_recovery_constraint',
@@ -1136,7 +1179,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
 
                 # Add flux constraints for seawater configuration
                 for i in range(1, n_stages + 1):
-                    ro = getattr(m.fs, f"ro_stage{i}")
+                    ro = ro_stages[i - 1]
                     stage_data = config_data['stages'][i-1]
                     target_flux_lmh = stage_data.get('flux_target_lmh')
                     if False and target_flux_lmh:  # TEMPORARILY DISABLED FOR DEBUGGING
@@ -1145,10 +1188,10 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
 
                         # Apply average flux constraint instead of constraining every point
                         # This is less restrictive and should help convergence
-                        from pyomo.environ import sum_product
-                        n_points = len(ro.feed_side.length_domain)
-                        avg_flux = sum(ro.flux_mass_phase_comp[0, x, 'Liq', 'H2O']
-                                     for x in ro.feed_side.length_domain) / n_points
+                        length_points = list(ro.feed_side.length_domain)
+                        n_points = len(length_points)
+                        avg_flux = quicksum(ro.flux_mass_phase_comp[0, x, 'Liq', 'H2O']
+                                          for x in length_points) / n_points
                         flux_avg_name = f"flux_avg_constraint_stage{i}"
                         setattr(m.fs, flux_avg_name,
                                 Constraint(expr=avg_flux >= target_flux_kg_m2_s))
@@ -1156,8 +1199,8 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
 
             else:
                 for i in range(1, n_stages + 1):
-                    pump = getattr(m.fs, f"pump{i}")
-                    ro = getattr(m.fs, f"ro_stage{i}")
+                    pump = pumps[i - 1]
+                    ro = ro_stages[i - 1]
                     stage_data = config_data['stages'][i-1]
                     target_recovery = stage_data.get('stage_recovery', 0.5)
 
@@ -1213,10 +1256,10 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
 
                         # Apply average flux constraint instead of constraining every point
                         # This is less restrictive and should help convergence
-                        from pyomo.environ import sum_product
-                        n_points = len(ro.feed_side.length_domain)
-                        avg_flux = sum(ro.flux_mass_phase_comp[0, x, 'Liq', 'H2O']
-                                     for x in ro.feed_side.length_domain) / n_points
+                        length_points = list(ro.feed_side.length_domain)
+                        n_points = len(length_points)
+                        avg_flux = quicksum(ro.flux_mass_phase_comp[0, x, 'Liq', 'H2O']
+                                          for x in length_points) / n_points
                         flux_avg_name = f"flux_avg_constraint_stage{i}"
                         setattr(m.fs, flux_avg_name,
                                 Constraint(expr=avg_flux >= target_flux_kg_m2_s))
@@ -1323,7 +1366,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 )
 
                 def _stage_upper_rule(fs, i):
-                    ro_blk = getattr(fs, f"ro_stage{i}")
+                    ro_blk = ro_stages[i - 1]
                     return (
                         ro_blk.recovery_mass_phase_comp[0, 'Liq', 'H2O']
                         <= fs.stage_recovery_target[i]
@@ -1332,7 +1375,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                     )
 
                 def _stage_lower_rule(fs, i):
-                    ro_blk = getattr(fs, f"ro_stage{i}")
+                    ro_blk = ro_stages[i - 1]
                     return (
                         ro_blk.recovery_mass_phase_comp[0, 'Liq', 'H2O']
                         >= fs.stage_recovery_target[i]
@@ -1381,21 +1424,22 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                         initialize=0.0,
                     )
 
+                    # Fresh-feed and disposal H2O flows, shared by both bounds
+                    fresh_h2o = m.fs.fresh_feed.properties[0].flow_mass_phase_comp['Liq', 'H2O']
+                    disposal_h2o = m.fs.disposal_product.inlet.flow_mass_phase_comp[0, 'Liq', 'H2O']
+                    system_recovery = (fresh_h2o - disposal_h2o) / fresh_h2o
+
                     def _system_upper_rule(fs):
-                        fresh_h2o = fs.fresh_feed.properties[0].flow_mass_phase_comp['Liq', 'H2O']
-                        disposal_h2o = fs.disposal_product.inlet.flow_mass_phase_comp[0, 'Liq', 'H2O']
                         return (
-                            (fresh_h2o - disposal_h2o) / fresh_h2o
+                            system_recovery
                             <= fs.system_recovery_target
                             + fs.system_recovery_tolerance
                             + fs.system_recovery_slack_pos
                         )
 
                     def _system_lower_rule(fs):
-                        fresh_h2o = fs.fresh_feed.properties[0].flow_mass_phase_comp['Liq', 'H2O']
-                        disposal_h2o = fs.disposal_product.inlet.flow_mass_phase_comp[0, 'Liq', 'H2O']
                         return (
-                            (fresh_h2o - disposal_h2o) / fresh_h2o
+                            system_recovery
                             >= fs.system_recovery_target
                             - fs.system_recovery_tolerance
                             - fs.system_recovery_slack_neg
@@ -1409,7 +1453,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                     m.fs.system_recovery_lower = Constraint(rule=_system_lower_rule)
 
                 slack_penalty_weight = config_data.get('recovery_slack_penalty', 1e6)
-                penalty_expr = sum(
+                penalty_expr = quicksum(
                     slack_penalty_weight
                     * (m.fs.stage_recovery_slack_pos[i] ** 2 + m.fs.stage_recovery_slack_neg[i] ** 2)
                     for i in m.fs.stage_index
@@ -1437,7 +1481,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 objective_expr = 0
 
                 for i in range(1, n_stages + 1):
-                    ro_blk = getattr(m.fs, f"ro_stage{i}")
+                    ro_blk = ro_stages[i - 1]
                     stage_cfg = stage_config_list[i - 1]
                     design_flux_lmh = stage_cfg.get('design_flux_lmh', 18)
                     design_flux_kg = design_flux_lmh / 3.6e6 if design_flux_lmh else 1.0
@@ -1445,7 +1489,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                     objective_expr += 3 * ((avg_flux - design_flux_kg) / design_flux_kg) ** 2
 
                 for i in range(1, n_stages + 1):
-                    pump_blk = getattr(m.fs, f"pump{i}")
+                    pump_blk = pumps[i - 1]
                     stage_cfg = stage_config_list[i - 1]
                     design_pressure_pa = stage_cfg.get('feed_pressure_bar', 10) * 1e5
                     objective_expr += ((pump_blk.outlet.pressure[0] - design_pressure_pa) / design_pressure_pa) ** 2
@@ -1504,16 +1548,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 
                 # Solve model with symbolic labels for debugging
                 try:
-                    results = solver.solve(m, tee=False, symbolic_solver_labels=True, options={
-                        'linear_solver': 'ma27',
-                        'max_cpu_time': 600,  # 10 minutes for main solve
-                        'tol': 1e-6,  # Moderately relaxed for balance of speed/accuracy
-                        'constr_viol_tol': 1e-6,
-                        'acceptable_tol': 1e-3,  # Fallback for difficult problems
-                        'acceptable_constr_viol_tol': 1e-3,
-                        'print_level': 0,  # Suppress all IPOPT output
-                        'halt_on_ampl_error': 'yes'  # Stop immediately on AMPL error
-                    })
+                    results = solver.solve(m, tee=False, symbolic_solver_labels=True, options=IPOPT_MAIN_OPTIONS)
                 except Exception as e:
                     logger.error(f"\n=== AMPL ERROR DIAGNOSTICS (Iteration {iteration+1}) ===")
                     logger.error(f"Error message: {str(e)}")
@@ -1521,8 +1556,8 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                     # Try to extract problematic values
                     for i in range(1, n_stages + 1):
                         try:
-                            ro = getattr(m.fs, f"ro_stage{i}")
-                            pump = getattr(m.fs, f"pump{i}")
+                            ro = ro_stages[i - 1]
+                            pump = pumps[i - 1]
 
                             # Check pressures
                             feed_p = value(ro.inlet.pressure[0])/1e5
@@ -1538,23 +1573,24 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                         except Exception as diag_e:
                             logger.error(f"Stage {i} diagnostic failed: {str(diag_e)}")
 
-                    # DIAGNOSTIC: Check pump actual values
-                    logger.info("\n=== PUMP DIAGNOSTIC AFTER SOLVE ===")
-                    for i in range(1, n_stages + 1):
-                        try:
-                            pump = getattr(m.fs, f"pump{i}")
-                            logger.info(f"\nPump {i}:")
-                            logger.info(f"  Inlet pressure: {value(pump.inlet.pressure[0])/1e5:.2f} bar ({value(pump.inlet.pressure[0]):.0f} Pa)")
-                            logger.info(f"  Outlet pressure: {value(pump.outlet.pressure[0])/1e5:.2f} bar ({value(pump.outlet.pressure[0]):.0f} Pa)")
-                            if hasattr(pump, 'deltaP'):
-                                logger.info(f"  DeltaP: {value(pump.deltaP[0])/1e5:.2f} bar")
-                            logger.info(f"  Inlet flow: {value(pump.control_volume.properties_in[0].flow_vol)*3600:.2f} m³/h")
-                            logger.info(f"  Work mechanical: {value(pump.work_mechanical[0])/1000:.2f} kW")
-                            if hasattr(pump, 'work_fluid'):
-                                logger.info(f"  Work fluid: {value(pump.work_fluid[0])/1000:.2f} kW")
-                            logger.info(f"  Efficiency: {value(pump.efficiency_pump[0]):.3f}")
-                        except Exception as pump_diag_e:
-                            logger.error(f"Pump {i} diagnostic failed: {str(pump_diag_e)}")
+                    # DIAGNOSTIC: Check pump actual values (INFO-only, skip the value() reads when filtered)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("\n=== PUMP DIAGNOSTIC AFTER SOLVE ===")
+                        for i in range(1, n_stages + 1):
+                            try:
+                                pump = pumps[i - 1]
+                                logger.info(f"\nPump {i}:")
+                                logger.info(f"  Inlet pressure: {value(pump.inlet.pressure[0])/1e5:.2f} bar ({value(pump.inlet.pressure[0]):.0f} Pa)")
+                                logger.info(f"  Outlet pressure: {value(pump.outlet.pressure[0])/1e5:.2f} bar ({value(pump.outlet.pressure[0]):.0f} Pa)")
+                                if hasattr(pump, 'deltaP'):
+                                    logger.info(f"  DeltaP: {value(pump.deltaP[0])/1e5:.2f} bar")
+                                logger.info(f"  Inlet flow: {value(pump.control_volume.properties_in[0].flow_vol)*3600:.2f} m³/h")
+                                logger.info(f"  Work mechanical: {value(pump.work_mechanical[0])/1000:.2f} kW")
+                                if hasattr(pump, 'work_fluid'):
+                                    logger.info(f"  Work fluid: {value(pump.work_fluid[0])/1000:.2f} kW")
+                                logger.info(f"  Efficiency: {value(pump.efficiency_pump[0]):.3f}")
+                            except Exception as pump_diag_e:
+                                logger.error(f"Pump {i} diagnostic failed: {str(pump_diag_e)}")
 
                     # Check mixer state if recycle
                     if has_recycle:
@@ -1587,16 +1623,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         else:
             # Single solve for non-recycle or fixed pump cases with symbolic labels
             try:
-                results = solver.solve(m, tee=False, symbolic_solver_labels=True, options={
-                    'linear_solver': 'ma27',
-                    'max_cpu_time': 600,  # 10 minutes for main solve
-                    'tol': 1e-6,  # Moderately relaxed for balance of speed/accuracy
-                    'constr_viol_tol': 1e-6,
-                    'acceptable_tol': 1e-3,  # Fallback for difficult problems
-                    'acceptable_constr_viol_tol': 1e-3,
-                    'print_level': 0,  # Suppress all IPOPT output
-                    'halt_on_ampl_error': 'yes'  # Stop immediately on AMPL error
-                })
+                results = solver.solve(m, tee=False, symbolic_solver_labels=True, options=IPOPT_MAIN_OPTIONS)
             except Exception as e:
                 logger.error(f"\n=== AMPL ERROR DIAGNOSTICS ===")
                 logger.error(f"Error message: {str(e)}")
@@ -1604,8 +1631,8 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 # Try to extract problematic values
                 for i in range(1, n_stages + 1):
                     try:
-                        ro = getattr(m.fs, f"ro_stage{i}")
-                        pump = getattr(m.fs, f"pump{i}")
+                        ro = ro_stages[i - 1]
+                        pump = pumps[i - 1]
 
                         # Check pressures
                         feed_p = value(ro.inlet.pressure[0])/1e5
@@ -1658,7 +1685,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                 def _stage_recovery_violation():
                     worst = 0.0
                     for idx in m.fs.stage_index:
-                        ro_blk = getattr(m.fs, f"ro_stage{idx}")
+                        ro_blk = ro_stages[idx - 1]
                         actual = value(ro_blk.recovery_mass_phase_comp[0, 'Liq', 'H2O'])
                         target = value(m.fs.stage_recovery_target[idx])
                         tol = value(m.fs.recovery_tolerance[idx])
@@ -1806,26 +1833,27 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                         f"Phase 2 ended with deviation {max(stage_violation, system_violation)*100:.2f}% (> ±{final_recovery_tolerance*100:.1f}%)"
                     )
 
-                logger.info("Final slack variable values:")
-                for idx in m.fs.stage_index:
-                    pos_val = value(m.fs.stage_recovery_slack_pos[idx])
-                    neg_val = value(m.fs.stage_recovery_slack_neg[idx])
-                    if max(pos_val, neg_val) > 1e-8:
-                        logger.info(
-                            f"  Stage {idx}: slack_pos={pos_val:.6f}, slack_neg={neg_val:.6f}"
-                        )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Final slack variable values:")
+                    for idx in m.fs.stage_index:
+                        pos_val = value(m.fs.stage_recovery_slack_pos[idx])
+                        neg_val = value(m.fs.stage_recovery_slack_neg[idx])
+                        if max(pos_val, neg_val) > 1e-8:
+                            logger.info(
+                                f"  Stage {idx}: slack_pos={pos_val:.6f}, slack_neg={neg_val:.6f}"
+                            )
 
-                if has_recycle:
-                    pos_val = value(m.fs.system_recovery_slack_pos)
-                    neg_val = value(m.fs.system_recovery_slack_neg)
-                    if max(pos_val, neg_val) > 1e-8:
-                        logger.info(
-                            f"  System: slack_pos={pos_val:.6f}, slack_neg={neg_val:.6f}"
-                        )
+                    if has_recycle:
+                        pos_val = value(m.fs.system_recovery_slack_pos)
+                        neg_val = value(m.fs.system_recovery_slack_neg)
+                        if max(pos_val, neg_val) > 1e-8:
+                            logger.info(
+                                f"  System: slack_pos={pos_val:.6f}, slack_neg={neg_val:.6f}"
+                            )
 
                 total_permeate = sum(
-                    value(getattr(m.fs, f"ro_stage{idx}").mixed_permeate[0].flow_mass_phase_comp['Liq', 'H2O'])
-                    for idx in range(1, n_stages + 1)
+                    value(ro_blk.mixed_permeate[0].flow_mass_phase_comp['Liq', 'H2O'])
+                    for ro_blk in ro_stages
                 )
                 feed_h2o = value(m.fs.feed.properties[0].flow_mass_phase_comp['Liq', 'H2O'])
                 final_recovery = total_permeate / feed_h2o if feed_h2o > 0 else 0.0
@@ -1848,7 +1876,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
                     constraint.deactivate()
 
                     # Add relaxed constraint
-                    ro = getattr(m.fs, f"ro_stage{i}")
+                    ro = ro_stages[i - 1]
                     stage_data = config_data['stages'][i-1]
                     target_recovery = stage_data.get('target_recovery', 0.70)
                     recovery_tolerance = 0.02  # Relax to 2%
@@ -1881,8 +1909,8 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         
         # Report final recoveries and pressures
         for i in range(1, n_stages + 1):
-            pump = getattr(m.fs, f"pump{i}")
-            ro = getattr(m.fs, f"ro_stage{i}")
+            pump = pumps[i - 1]
+            ro = ro_stages[i - 1]
             
             pressure = value(pump.outlet.pressure[0]) / 1e5  # bar
             recovery = value(ro.recovery_mass_phase_comp[0, 'Liq', 'H2O'])
@@ -1893,7 +1921,7 @@ def initialize_and_solve_mcas(model, config_data, optimize_pumps=True, use_stage
         if has_recycle:
             logger.info("\n=== Concentrate Flow Verification ===")
             for i in range(1, n_stages + 1):
-                ro = getattr(m.fs, f"ro_stage{i}")
+                ro = ro_stages[i - 1]
                 stage_data = config_data['stages'][i-1]
                 n_vessels = stage_data.get('n_vessels', 1)
 
@@ -1947,12 +1975,7 @@ def initialize_model_sequential(m, config_data):
         pump = getattr(m.fs, f"pump{i}")
         
         # Set outlet pressure based on stage and expected osmotic pressure
-        if i == 1:
-            pump.outlet.pressure.fix(15 * pyunits.bar)  # 15 bar
-        elif i == 2:
-            pump.outlet.pressure.fix(25 * pyunits.bar)  # 25 bar (higher due to concentration)
-        else:
-            pump.outlet.pressure.fix(35 * pyunits.bar)  # 35 bar
+        pump.outlet.pressure.fix(SEQUENTIAL_INIT_PRESSURES[min(i, 3) - 1])
         
         pump.efficiency_pump.fix(0.8)
         
@@ -2061,22 +2084,24 @@ def initialize_with_custom_guess(m, config_data):
         3: 35e5    # 35 bar
     }
     
-    # Set pump pressures
+    # Resolve stage blocks once for the three passes below
     n_stages = config_data.get('n_stages', config_data.get('stage_count', 1))
-    for i in range(1, n_stages + 1):
-        pump = getattr(m.fs, f"pump{i}")
+    pumps = [getattr(m.fs, f"pump{i}") for i in range(1, n_stages + 1)]
+    ro_stages = [getattr(m.fs, f"ro_stage{i}") for i in range(1, n_stages + 1)]
+    
+    # Set pump pressures
+    for i, pump in enumerate(pumps, start=1):
         if i in stage_pressures:
             pump.outlet.pressure.set_value(stage_pressures[i])
     
     # Set RO recoveries based on configuration (as initial guesses only)
-    n_stages = config_data.get('n_stages', config_data.get('stage_count', 1))
-    for i in range(1, n_stages + 1):
-        ro = getattr(m.fs, f"ro_stage{i}")
+    component_list = tuple(m.fs.properties.component_list)
+    for i, ro in enumerate(ro_stages, start=1):
         stage_data = config_data['stages'][i-1]
         target_recovery = stage_data.get('stage_recovery', 0.5)
         
         # Set recovery for each component (just as initial values, not fixed)
-        for comp in m.fs.properties.component_list:
+        for comp in component_list:
             if comp == "H2O":
                 ro.recovery_mass_phase_comp[0, 'Liq', comp].set_value(target_recovery)
             else:
@@ -2086,10 +2111,7 @@ def initialize_with_custom_guess(m, config_data):
     # Set approximate flows
     feed_flow = config_data['feed_flow_m3h'] / 3600  # m³/s
     
-    n_stages = config_data.get('n_stages', config_data.get('stage_count', 1))
-    for i in range(1, n_stages + 1):
-        ro = getattr(m.fs, f"ro_stage{i}")
-        
+    for i, ro in enumerate(ro_stages, start=1):
         # Approximate permeate and concentrate flows
         if i == 1:
             inlet_flow = feed_flow
@@ -2157,11 +2179,12 @@ def initialize_model_advanced(m, config_data, strategy="sequential"):
     # Verify initialization
     logger.info("\nChecking initialization...")
     n_stages = config_data.get('n_stages', config_data.get('stage_count', 1))
+    component_list = tuple(m.fs.properties.component_list)
     for i in range(1, n_stages + 1):
         ro = getattr(m.fs, f"ro_stage{i}")
         perm_flow = value(sum(
             ro.permeate.flow_mass_phase_comp[0, 'Liq', comp]
-            for comp in m.fs.properties.component_list
+            for comp in component_list
         )) / 1000 * 3600  # m³/h
         
         logger.info(f"  Stage {i} permeate flow: {perm_flow:.1f} m³/h")